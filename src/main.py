@@ -27,6 +27,7 @@ from world.npcs import get_npc_manager
 from opensim import get_opensim_config, init_opensim_bridge, get_opensim_bridge
 from spectator import get_spectator_manager, init_spectator_manager
 from worlds import worlds_router
+from worlds.api import spawner as world_spawner
 
 
 # ========== APP SETUP ==========
@@ -314,6 +315,8 @@ async def startup():
 async def shutdown():
     """Stop world simulation."""
     world.stop()
+    registry.flush()
+    await world_spawner.close()
     print("🛑 ClawBots Platform stopped")
 
 
@@ -325,7 +328,8 @@ def main():
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=True,
+        loop="auto"  # uvloop when installed (uvicorn[standard]); runs the OpenSim bridge loops too
     )
 
 
@@ -892,8 +896,8 @@ async def get_spectator_state(session_id: str):
     return {
         "session": session.to_dict(),
         "agent": agent_info,
-        "recent_thoughts": [t.to_dict() for t in session.thought_history[-10:]],
-        "recent_chat": session.chat_history[-20:]
+        "recent_thoughts": session.recent_thoughts(10),
+        "recent_chat": session.recent_chat(20)
     }
 
 
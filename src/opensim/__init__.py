@@ -3,11 +3,15 @@ ClawBots OpenSim Integration
 
 Connects ClawBots to OpenSim virtual world grid.
 Bots appear as real avatars that humans can see and interact with.
+
+Standalone scripts driving the bridge or controller can call
+install_uvloop() before asyncio.run() to get the faster event loop the
+API server already uses.
 """
 
 from .config import OpenSimConfig, get_opensim_config, set_opensim_config
 from .remote_admin import RemoteAdminClient, UserAccount
-from .bot_controller import BotController, BotAvatar, BotState
+from .bot_controller import BotController, BotAvatar, BotState, install_uvloop
 from .bridge import OpenSimBridge, get_opensim_bridge, init_opensim_bridge
 
 __all__ = [
@@ -19,6 +23,7 @@ __all__ = [
     "BotController",
     "BotAvatar",
     "BotState",
+    "install_uvloop",
     "OpenSimBridge",
     "get_opensim_bridge",
     "init_opensim_bridge"
@@ -5,7 +5,7 @@ Controls bot avatars in OpenSim grid.
 Handles login, movement, chat, and animations.
 """
 
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -13,6 +13,23 @@ import asyncio
 import aiohttp
 import hashlib
 import json
+import time
+
+# Prefer orjson for request/response bodies, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if HAS_ORJSON:
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+else:
+    def json_dumps(obj: Any) -> bytes:
+        """Encode compact JSON as UTF-8 bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+    json_loads = json.loads
 
 
 class BotState(Enum):
@@ -25,7 +42,66 @@ class BotState(Enum):
     ERROR = "error"
 
 
-@dataclass
+ONLINE_STATES = frozenset({BotState.ONLINE, BotState.MOVING, BotState.SITTING})
+
+# Shared request options, reused by every POST instead of rebuilt per call
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_ACTION_TIMEOUT = aiohttp.ClientTimeout(total=5, connect=2)
+
+# Move body tail appended to the auth prefix; %a of a float is its repr,
+# which is valid JSON for finite values
+_MOVE_TEMPLATE = b',"position":[%a,%a,%a]}'
+
+# Connection pool for grid HTTP traffic
+GRID_POOL_LIMIT = 64
+GRID_POOL_LIMIT_PER_HOST = 32
+GRID_KEEPALIVE_TIMEOUT = 60.0
+
+
+def create_grid_session() -> aiohttp.ClientSession:
+    """Create an HTTP session with a keep-alive pool sized for bot traffic."""
+    connector = aiohttp.TCPConnector(
+        limit=GRID_POOL_LIMIT,
+        limit_per_host=GRID_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=GRID_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=600
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        json_serialize=lambda obj: json_dumps(obj).decode()
+    )
+
+
+# Update loop timing (seconds)
+MOVING_TICK = 0.25   # While any bot is moving, to settle it promptly
+IDLE_TICK = 5.0      # Heartbeat when the whole fleet is idle
+MOVE_SETTLE = 0.5    # A bot stops MOVING this long after its last move
+
+# Grid circuit breaker: open after this many consecutive failures, then
+# skip grid calls for a cooldown that doubles on each re-trip (capped)
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 10.0
+BREAKER_MAX_COOLDOWN = 300.0
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop for new event loops, if it is installed.
+    
+    Must be called before the loop starts (i.e. before asyncio.run()),
+    so standalone scripts driving a BotController should call it first.
+    The API server already gets uvloop via uvicorn[standard].
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+@dataclass(slots=True)
 class BotAvatar:
     """
     A bot avatar in OpenSim.
@@ -51,20 +127,41 @@ class BotAvatar:
     # State
     state: BotState = BotState.OFFLINE
     last_update: float = 0.0
+    last_move: float = 0.0  # time.monotonic() of the last move
     error_message: str = ""
+    is_mock: bool = False   # Logged in via mock fallback (no grid calls)
     
     # Stats
     login_time: Optional[str] = None
     message_count: int = 0
     move_count: int = 0
     
+    # Pre-encoded '{"session_id":"..."' request prefix, built at login
+    auth_prefix: bytes = field(default=b'{"session_id":""', repr=False)
+    agent_url: str = field(default="", repr=False)   # "<grid>/agent/<uuid>/"
+    
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
     
     @property
     def is_online(self) -> bool:
-        return self.state in (BotState.ONLINE, BotState.MOVING, BotState.SITTING)
+        return self.state in ONLINE_STATES
+    
+    def set_session(self, session_id: str):
+        """Store the session ID and pre-encode the auth prefix for requests."""
+        self.session_id = session_id
+        self.auth_prefix = json_dumps({"session_id": session_id})[:-1]
+    
+    def auth_body(self, payload: Optional[Dict[str, Any]] = None) -> bytes:
+        """Encode a request body with the session ID prepended."""
+        if not payload:
+            return self.auth_prefix + b"}"
+        return self.auth_prefix + b"," + json_dumps(payload)[1:]
+    
+    def move_body(self, x: float, y: float, z: float) -> bytes:
+        """Encode a move request body from a fixed template (no dict/JSON encode)."""
+        return self.auth_prefix + _MOVE_TEMPLATE % (float(x), float(y), float(z))
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -89,12 +186,30 @@ class BotController:
     For full avatar control, integrates with LibreMetaverse-style protocols.
     """
     
-    def __init__(self, grid_url: str, login_uri: Optional[str] = None):
+    def __init__(
+        self,
+        grid_url: str,
+        login_uri: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         self.grid_url = grid_url.rstrip('/')
         self.login_uri = login_uri or f"{self.grid_url}/"
         
         self.bots: Dict[str, BotAvatar] = {}
-        self.session: Optional[aiohttp.ClientSession] = None
+        
+        # State indexes (kept in sync by _set_state)
+        self._online_ids: Set[str] = set()
+        self._moving_ids: Set[str] = set()
+        self._uuid_index: Dict[str, BotAvatar] = {}   # OpenSim UUID -> logged-in bot
+        self._by_region: Dict[str, Set[str]] = {}     # Region -> logged-in agent IDs
+        
+        # Running stats (kept up to date at the increment sites)
+        self._total_messages = 0
+        self._total_moves = 0
+        self._bots_dirty = True
+        self._bots_snapshot: List[Dict[str, Any]] = []
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         
         # Event callbacks
         self._on_chat: List[Callable] = []
@@ -104,10 +219,18 @@ class BotController:
         # Background tasks
         self._running = False
         self._update_task: Optional[asyncio.Task] = None
+        self._bg_tasks: Set[asyncio.Task] = set()
+        
+        # Grid circuit breaker
+        self._grid_failures = 0
+        self._grid_open_until = 0.0
+        self._grid_cooldown = BREAKER_COOLDOWN
+        self._wake = asyncio.Event()   # Set when an idle fleet gets a mover
     
     async def start(self):
         """Start the bot controller."""
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = create_grid_session()
         self._running = True
         self._update_task = asyncio.create_task(self._update_loop())
         print("🤖 Bot Controller started")
@@ -116,6 +239,9 @@ class BotController:
         """Stop the bot controller."""
         self._running = False
         
+        # Let pending background requests go out before the bots log off
+        await self.flush()
+        
         # Logout all bots
         for agent_id in list(self.bots.keys()):
             await self.logout_bot(agent_id)
@@ -123,13 +249,56 @@ class BotController:
         if self._update_task:
             self._update_task.cancel()
         
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
         
         print("🤖 Bot Controller stopped")
     
+    async def flush(self):
+        """Wait for all fire-and-forget requests to finish."""
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until done."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+    
     # ========== BOT LIFECYCLE ==========
     
+    def _set_state(self, bot: BotAvatar, state: BotState):
+        """Set a bot's state and keep the online/moving indexes in sync."""
+        bot.state = state
+        self._bots_dirty = True
+        
+        if state in ONLINE_STATES:
+            self._online_ids.add(bot.agent_id)
+        else:
+            self._online_ids.discard(bot.agent_id)
+        
+        if state == BotState.MOVING:
+            if not self._moving_ids:
+                self._wake.set()
+            self._moving_ids.add(bot.agent_id)
+        else:
+            self._moving_ids.discard(bot.agent_id)
+    
+    def _set_region(self, bot: BotAvatar, region: str):
+        """Set a logged-in bot's region and move it between region buckets."""
+        self._unindex_region(bot)
+        bot.region = region
+        self._by_region.setdefault(region, set()).add(bot.agent_id)
+    
+    def _unindex_region(self, bot: BotAvatar):
+        """Remove a bot from its region bucket."""
+        members = self._by_region.get(bot.region)
+        if members is not None:
+            members.discard(bot.agent_id)
+            if not members:
+                del self._by_region[bot.region]
+    
     async def create_bot(
         self,
         agent_id: str,
@@ -151,6 +320,7 @@ class BotController:
         )
         
         self.bots[agent_id] = bot
+        self._set_state(bot, BotState.OFFLINE)
         return bot
     
     async def login_bot(
@@ -168,7 +338,7 @@ class BotController:
         if not bot:
             return False
         
-        bot.state = BotState.LOGGING_IN
+        self._set_state(bot, BotState.LOGGING_IN)
         
         # Build login parameters (LLSD format)
         login_params = {
@@ -193,33 +363,36 @@ class BotController:
             # Try XML-RPC login
             async with self.session.post(
                 f"{self.login_uri}",
-                json={"method": "login_to_simulator", "params": [login_params]},
-                headers={"Content-Type": "application/json"}
+                data=json_dumps({"method": "login_to_simulator", "params": [login_params]}),
+                headers=_JSON_HEADERS
             ) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = json_loads(await resp.read())
                     
                     if data.get("login") == "true":
                         bot.uuid = data.get("agent_id", "")
-                        bot.session_id = data.get("session_id", "")
+                        bot.agent_url = f"{self.grid_url}/agent/{bot.uuid}/"
+                        bot.is_mock = False
+                        self._uuid_index[bot.uuid] = bot
+                        bot.set_session(data.get("session_id", ""))
                         bot.secure_session_id = data.get("secure_session_id", "")
-                        bot.region = data.get("region_name", region or "Unknown")
+                        self._set_region(bot, data.get("region_name", region or "Unknown"))
                         bot.x = float(data.get("position_x", 128))
                         bot.y = float(data.get("position_y", 128))
                         bot.z = float(data.get("position_z", 25))
-                        bot.state = BotState.ONLINE
+                        self._set_state(bot, BotState.ONLINE)
                         bot.login_time = datetime.utcnow().isoformat()
                         
                         print(f"✅ Bot logged in: {bot.full_name} @ {bot.region}")
                         return True
                     else:
-                        bot.state = BotState.ERROR
+                        self._set_state(bot, BotState.ERROR)
                         bot.error_message = data.get("message", "Login failed")
                         print(f"❌ Bot login failed: {bot.error_message}")
                         return False
                         
         except Exception as e:
-            bot.state = BotState.ERROR
+            self._set_state(bot, BotState.ERROR)
             bot.error_message = str(e)
             print(f"❌ Bot login error: {e}")
             
@@ -227,8 +400,10 @@ class BotController:
             if "Connection" in str(e) or "refused" in str(e):
                 print(f"⚠️ OpenSim not reachable, using mock mode for {bot.full_name}")
                 bot.uuid = f"mock-{agent_id}"
-                bot.region = region or "Bhairav"
-                bot.state = BotState.ONLINE
+                bot.is_mock = True
+                self._uuid_index[bot.uuid] = bot
+                self._set_region(bot, region or "Bhairav")
+                self._set_state(bot, BotState.ONLINE)
                 bot.login_time = datetime.utcnow().isoformat()
                 return True
         
@@ -240,24 +415,76 @@ class BotController:
         if not bot or not bot.is_online:
             return False
         
-        try:
-            # Send logout request
-            if bot.session_id and not bot.uuid.startswith("mock-"):
-                async with self.session.post(
-                    f"{self.grid_url}/agent/{bot.uuid}/logout",
-                    json={"session_id": bot.session_id}
-                ) as resp:
-                    pass  # Best effort
-        except:
-            pass
-        
-        bot.state = BotState.OFFLINE
-        bot.session_id = ""
+        if bot.session_id:
+            await self._do_action(bot, "logout")  # Best effort
+        
+        self._set_state(bot, BotState.OFFLINE)
+        self._uuid_index.pop(bot.uuid, None)
+        self._unindex_region(bot)
+        bot.set_session("")
         print(f"👋 Bot logged out: {bot.full_name}")
         return True
     
     # ========== BOT ACTIONS ==========
     
+    async def _do_action(
+        self,
+        bot: BotAvatar,
+        verb: str,
+        payload: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None
+    ) -> bool:
+        """
+        POST an action for a bot to the grid.
+        
+        The request body is encoded from payload, unless a pre-encoded
+        body is given.
+        
+        Returns False only if the grid answered with a non-200 status.
+        Mock bots and unreachable grids count as success so callers
+        still apply the local state update. While the circuit breaker is
+        open the grid is treated as unreachable and not contacted.
+        """
+        if bot.is_mock or time.monotonic() < self._grid_open_until:
+            return True
+        
+        try:
+            async with self.session.post(
+                bot.agent_url + verb,
+                data=body if body is not None else bot.auth_body(payload),
+                headers=_JSON_HEADERS,
+                timeout=_ACTION_TIMEOUT
+            ) as resp:
+                self._grid_failures = 0
+                self._grid_cooldown = BREAKER_COOLDOWN
+                return resp.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._record_grid_failure()
+            return True
+    
+    def _record_grid_failure(self):
+        """Count a failed grid call and open the breaker past the threshold."""
+        self._grid_failures += 1
+        if self._grid_failures < BREAKER_THRESHOLD:
+            return
+        
+        self._grid_open_until = time.monotonic() + self._grid_cooldown
+        print(f"⚠️ Grid unreachable, pausing bot actions for {self._grid_cooldown:.0f}s")
+        self._grid_cooldown = min(self._grid_cooldown * 2, BREAKER_MAX_COOLDOWN)
+    
+    def _count_message(self, bot: BotAvatar):
+        """Count a sent message in the bot's and the controller's stats."""
+        bot.message_count += 1
+        self._total_messages += 1
+        self._bots_dirty = True
+    
+    def _get_online(self, agent_id: str) -> Optional[BotAvatar]:
+        """Get a bot if it exists and is online."""
+        bot = self.bots.get(agent_id)
+        if bot and bot.is_online:
+            return bot
+        return None
+    
     async def move_bot(
         self,
         agent_id: str,
@@ -266,32 +493,23 @@ class BotController:
         z: Optional[float] = None
     ) -> bool:
         """Move a bot to a position."""
-        bot = self.bots.get(agent_id)
-        if not bot or not bot.is_online:
+        bot = self._get_online(agent_id)
+        if not bot:
             return False
         
         target_z = z if z is not None else bot.z
         
-        try:
-            if not bot.uuid.startswith("mock-"):
-                async with self.session.post(
-                    f"{self.grid_url}/agent/{bot.uuid}/move",
-                    json={
-                        "session_id": bot.session_id,
-                        "position": [x, y, target_z]
-                    }
-                ) as resp:
-                    if resp.status != 200:
-                        return False
-        except:
-            pass  # Continue with local update
+        if not await self._do_action(bot, "move", body=bot.move_body(x, y, target_z)):
+            return False
         
         # Update local state
         bot.x = x
         bot.y = y
         bot.z = target_z
         bot.move_count += 1
-        bot.state = BotState.MOVING
+        bot.last_move = time.monotonic()
+        self._total_moves += 1
+        self._set_state(bot, BotState.MOVING)
         
         return True
     
@@ -302,51 +520,33 @@ class BotController:
         channel: int = 0
     ) -> bool:
         """Make a bot say something in local chat."""
-        bot = self.bots.get(agent_id)
-        if not bot or not bot.is_online:
+        bot = self._get_online(agent_id)
+        if not bot:
             return False
         
-        try:
-            if not bot.uuid.startswith("mock-"):
-                async with self.session.post(
-                    f"{self.grid_url}/agent/{bot.uuid}/chat",
-                    json={
-                        "session_id": bot.session_id,
-                        "message": message,
-                        "channel": channel,
-                        "type": 1  # Normal chat
-                    }
-                ) as resp:
-                    pass
-        except:
-            pass
+        await self._do_action(bot, "chat", {
+            "message": message,
+            "channel": channel,
+            "type": 1  # Normal chat
+        })
         
-        bot.message_count += 1
+        self._count_message(bot)
         print(f"💬 {bot.full_name}: {message}")
         return True
     
     async def bot_shout(self, agent_id: str, message: str) -> bool:
         """Make a bot shout (heard further away)."""
-        bot = self.bots.get(agent_id)
-        if not bot or not bot.is_online:
+        bot = self._get_online(agent_id)
+        if not bot:
             return False
         
-        try:
-            if not bot.uuid.startswith("mock-"):
-                async with self.session.post(
-                    f"{self.grid_url}/agent/{bot.uuid}/chat",
-                    json={
-                        "session_id": bot.session_id,
-                        "message": message,
-                        "channel": 0,
-                        "type": 2  # Shout
-                    }
-                ) as resp:
-                    pass
-        except:
-            pass
+        self._spawn(self._do_action(bot, "chat", {
+            "message": message,
+            "channel": 0,
+            "type": 2  # Shout
+        }))
         
-        bot.message_count += 1
+        self._count_message(bot)
         return True
     
     async def bot_whisper(
@@ -356,25 +556,21 @@ class BotController:
         message: str
     ) -> bool:
         """Send an instant message to another avatar."""
-        bot = self.bots.get(agent_id)
-        if not bot or not bot.is_online:
+        bot = self._get_online(agent_id)
+        if not bot:
             return False
         
-        try:
-            if not bot.uuid.startswith("mock-"):
-                async with self.session.post(
-                    f"{self.grid_url}/agent/{bot.uuid}/im",
-                    json={
-                        "session_id": bot.session_id,
-                        "target_id": target_uuid,
-                        "message": message
-                    }
-                ) as resp:
-                    pass
-        except:
-            pass
-        
-        bot.message_count += 1
+        # Target is one of our own bots: deliver in-process, skip the grid
+        local = self._uuid_index.get(target_uuid)
+        if local:
+            await self._emit(self._on_chat, bot, local, message)
+        else:
+            self._spawn(self._do_action(bot, "im", {
+                "target_id": target_uuid,
+                "message": message
+            }))
+        
+        self._count_message(bot)
         return True
     
     async def bot_animate(
@@ -384,48 +580,25 @@ class BotController:
         start: bool = True
     ) -> bool:
         """Play or stop an animation on a bot."""
-        bot = self.bots.get(agent_id)
-        if not bot or not bot.is_online:
+        bot = self._get_online(agent_id)
+        if not bot:
             return False
         
-        try:
-            if not bot.uuid.startswith("mock-"):
-                async with self.session.post(
-                    f"{self.grid_url}/agent/{bot.uuid}/animate",
-                    json={
-                        "session_id": bot.session_id,
-                        "animation": animation,
-                        "start": start
-                    }
-                ) as resp:
-                    pass
-        except:
-            pass
-        
+        self._spawn(self._do_action(bot, "animate", {
+            "animation": animation,
+            "start": start
+        }))
         return True
     
     async def bot_sit(self, agent_id: str, target_uuid: str) -> bool:
         """Make a bot sit on an object."""
-        bot = self.bots.get(agent_id)
-        if not bot or not bot.is_online:
+        bot = self._get_online(agent_id)
+        if not bot:
             return False
         
-        try:
-            if not bot.uuid.startswith("mock-"):
-                async with self.session.post(
-                    f"{self.grid_url}/agent/{bot.uuid}/sit",
-                    json={
-                        "session_id": bot.session_id,
-                        "target_id": target_uuid
-                    }
-                ) as resp:
-                    if resp.status == 200:
-                        bot.state = BotState.SITTING
-                        return True
-        except:
-            pass
+        await self._do_action(bot, "sit", {"target_id": target_uuid})
         
-        bot.state = BotState.SITTING
+        self._set_state(bot, BotState.SITTING)
         return True
     
     async def bot_stand(self, agent_id: str) -> bool:
@@ -434,17 +607,9 @@ class BotController:
         if not bot:
             return False
         
-        try:
-            if not bot.uuid.startswith("mock-"):
-                async with self.session.post(
-                    f"{self.grid_url}/agent/{bot.uuid}/stand",
-                    json={"session_id": bot.session_id}
-                ) as resp:
-                    pass
-        except:
-            pass
-        
-        bot.state = BotState.ONLINE
+        self._spawn(self._do_action(bot, "stand"))
+        
+        self._set_state(bot, BotState.ONLINE)
         return True
     
     async def bot_teleport(
@@ -456,36 +621,42 @@ class BotController:
         z: float = 25.0
     ) -> bool:
         """Teleport a bot to another region."""
-        bot = self.bots.get(agent_id)
-        if not bot or not bot.is_online:
+        bot = self._get_online(agent_id)
+        if not bot:
             return False
         
-        try:
-            if not bot.uuid.startswith("mock-"):
-                async with self.session.post(
-                    f"{self.grid_url}/agent/{bot.uuid}/teleport",
-                    json={
-                        "session_id": bot.session_id,
-                        "region": region,
-                        "position": [x, y, z]
-                    }
-                ) as resp:
-                    if resp.status == 200:
-                        bot.region = region
-                        bot.x, bot.y, bot.z = x, y, z
-                        return True
-        except:
-            pass
+        await self._do_action(bot, "teleport", {
+            "region": region,
+            "position": [x, y, z]
+        })
         
-        # Local update for mock
-        bot.region = region
+        self._set_region(bot, region)
         bot.x, bot.y, bot.z = x, y, z
+        self._bots_dirty = True
         return True
     
     # ========== EVENT HANDLING ==========
     
+    async def _emit(self, callbacks: List[Callable], *args):
+        """Run event callbacks concurrently so one slow handler can't stall the rest."""
+        if not callbacks:
+            return
+        
+        results = await asyncio.gather(
+            *(callback(*args) for callback in callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Event callback error: {result}")
+    
     def on_chat(self, callback: Callable):
-        """Register chat event callback."""
+        """
+        Register chat event callback.
+        
+        Called as ``await callback(sender, target, message)`` when a bot
+        messages another bot owned by this controller.
+        """
         self._on_chat.append(callback)
     
     def on_move(self, callback: Callable):
@@ -497,17 +668,52 @@ class BotController:
         self._on_event.append(callback)
     
     async def _update_loop(self):
-        """Background loop for updates and events."""
+        """
+        Background loop for updates and events.
+        
+        Ticks every MOVING_TICK while any bot is moving and every IDLE_TICK
+        otherwise. The first bot to start moving wakes an idle loop early.
+        """
         while self._running:
-            await asyncio.sleep(1.0)
+            delay = MOVING_TICK if self._moving_ids else IDLE_TICK
+            self._wake.clear()
+            try:
+                # asyncio.timeout reschedules one timer; wait_for would wrap
+                # the wait in a new Task every tick
+                async with asyncio.timeout(delay):
+                    await self._wake.wait()
+                continue  # Re-evaluate the tick rate
+            except TimeoutError:
+                pass
             
-            for bot in self.bots.values():
-                if bot.is_online:
-                    bot.last_update = datetime.utcnow().timestamp()
-                    
-                    # If was moving, set back to online
-                    if bot.state == BotState.MOVING:
-                        bot.state = BotState.ONLINE
+            if self._online_ids:
+                self._tick(time.time())
+    
+    def _tick(self, now: float):
+        """
+        Run one update: heartbeat online bots and settle movers.
+        
+        A bot settles back to ONLINE once MOVE_SETTLE has passed since
+        its own last move, so a bot that keeps moving stays MOVING.
+        """
+        bots = self.bots
+        
+        for agent_id in self._online_ids:
+            bots[agent_id].last_update = now
+        
+        if not self._moving_ids:
+            return
+        
+        settle_before = time.monotonic() - MOVE_SETTLE
+        to_restore = [
+            agent_id for agent_id in self._moving_ids
+            if bots[agent_id].last_move <= settle_before
+        ]
+        for agent_id in to_restore:
+            bots[agent_id].state = BotState.ONLINE
+        if to_restore:
+            self._moving_ids.difference_update(to_restore)
+            self._bots_dirty = True
     
     # ========== UTILITIES ==========
     
@@ -515,23 +721,38 @@ class BotController:
         """Get a bot by agent ID."""
         return self.bots.get(agent_id)
     
+    def get_bot_by_uuid(self, uuid: str) -> Optional[BotAvatar]:
+        """Get a logged-in bot by its OpenSim avatar UUID."""
+        return self._uuid_index.get(uuid)
+    
+    def get_bots_in_region(self, region: str) -> List[BotAvatar]:
+        """Get all logged-in bots in a region."""
+        return [self.bots[agent_id] for agent_id in self._by_region.get(region, ())]
+    
     def get_all_bots(self) -> List[BotAvatar]:
         """Get all bots."""
         return list(self.bots.values())
     
     def get_online_bots(self) -> List[BotAvatar]:
         """Get all online bots."""
-        return [b for b in self.bots.values() if b.is_online]
+        return [self.bots[agent_id] for agent_id in self._online_ids]
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get controller statistics."""
-        bots = self.get_all_bots()
-        online = self.get_online_bots()
+        """
+        Get controller statistics.
+        
+        Totals are running counters; the per-bot dicts are only rebuilt
+        after some bot changed since the last call. Each call gets its own
+        "bots" list, but the dicts in it are shared; do not modify them.
+        """
+        if self._bots_dirty:
+            self._bots_snapshot = [b.to_dict() for b in self.bots.values()]
+            self._bots_dirty = False
         
         return {
-            "total_bots": len(bots),
-            "online_bots": len(online),
-            "total_messages": sum(b.message_count for b in bots),
-            "total_moves": sum(b.move_count for b in bots),
-            "bots": [b.to_dict() for b in bots]
+            "total_bots": len(self.bots),
+            "online_bots": len(self._online_ids),
+            "total_messages": self._total_messages,
+            "total_moves": self._total_moves,
+            "bots": list(self._bots_snapshot)
         }
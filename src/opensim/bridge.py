@@ -5,17 +5,53 @@ Full integration between ClawBots platform and OpenSim grid.
 Manages bot avatars as real OpenSim avatars.
 """
 
-from typing import Optional, Dict, List, Any, Callable
+from typing import Optional, Dict, List, Any, Callable, Set, Tuple
 from dataclasses import dataclass
-from datetime import datetime
 import asyncio
+import aiohttp
+import logging
+import time
 
 from .config import OpenSimConfig, get_opensim_config
-from .remote_admin import RemoteAdminClient, UserAccount
-from .bot_controller import BotController, BotAvatar, BotState
+from .remote_admin import RemoteAdminClient
+from .bot_controller import BotController, BotAvatar, create_grid_session
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Fallback interval for catching position changes that emit no world event
+# (e.g. agents following each other are moved in place)
+SYNC_INTERVAL = 0.5
+
+# Cap for the sync loop's exponential backoff after repeated errors
+SYNC_MAX_BACKOFF = 60.0
+
+# Minimum horizontal distance an agent must move before its bot follows
+SYNC_MIN_DISTANCE = 1.0
+_SYNC_MIN_DISTANCE_SQ = SYNC_MIN_DISTANCE * SYNC_MIN_DISTANCE
+
+# World event types that should trigger an immediate position sync
+SYNC_EVENT_TYPES = frozenset({"movement", "teleport"})
+
+# Map emote names to OpenSim animations
+ANIMATION_MAP: Dict[str, str] = {
+    "wave": "wave",
+    "nod": "nod",
+    "laugh": "laugh",
+    "dance": "dance1",
+    "sit": "sit",
+    "stand": "stand",
+    "bow": "bow",
+    "shrug": "shrug",
+    "think": "think"
+}
+
+
+def _first_name(name: str) -> str:
+    """First word of a display name (one scan, no list allocation)."""
+    return name.strip().partition(" ")[0]
+
+
+@dataclass(slots=True)
 class BotCredentials:
     """Stored credentials for a bot account."""
     agent_id: str
@@ -45,6 +81,9 @@ class OpenSimBridge:
         self.admin: Optional[RemoteAdminClient] = None
         self.controller: Optional[BotController] = None
         
+        # Pooled HTTP session shared by everything talking to the grid
+        self.session: Optional[aiohttp.ClientSession] = None
+        
         # Bot credentials storage
         self.credentials: Dict[str, BotCredentials] = {}
         
@@ -52,6 +91,11 @@ class OpenSimBridge:
         self.connected = False
         self._running = False
         self._sync_task: Optional[asyncio.Task] = None
+        self._sync_wake = asyncio.Event()   # Set by world movement events
+        self._pending_sync: Set[str] = set()  # Agents moved since last pass
+        self._sync_failures = 0
+        self._location_caps: Dict[type, Tuple[bool, bool]] = {}  # type -> (has x/y, has z)
+        self._subscribed = False
         
         # Callbacks
         self._on_ready: List[Callable] = []
@@ -65,40 +109,53 @@ class OpenSimBridge:
         Initializes RemoteAdmin and BotController.
         """
         try:
-            # Initialize RemoteAdmin
+            if self.session is None or self.session.closed:
+                self.session = create_grid_session()
+            
+            # Initialize RemoteAdmin on the shared session
             self.admin = RemoteAdminClient(
                 url=self.config.remote_admin_url,
-                password=self.config.remote_admin_password
+                password=self.config.remote_admin_password,
+                session=self.session
             )
             
             # Test connection
             if await self.admin.ping():
-                print(f"✅ Connected to OpenSim RemoteAdmin: {self.config.remote_admin_url}")
+                logger.info("✅ Connected to OpenSim RemoteAdmin: %s", self.config.remote_admin_url)
             else:
-                print(f"⚠️ RemoteAdmin not responding, continuing in mock mode")
+                logger.warning("⚠️ RemoteAdmin not responding, continuing in mock mode")
             
-            # Initialize BotController
+            # Initialize BotController on the shared session
             self.controller = BotController(
                 grid_url=self.config.grid_url,
-                login_uri=f"{self.config.grid_url}/"
+                login_uri=f"{self.config.grid_url}/",
+                session=self.session
             )
             await self.controller.start()
             
             self.connected = True
             self._running = True
             
-            # Start sync loop
+            # Start sync loop, woken early by world movement events
+            if self.world and not self._subscribed:
+                self.world.on_event(self._on_world_event)
+                self._subscribed = True
             self._sync_task = asyncio.create_task(self._sync_loop())
             
-            # Notify ready callbacks
-            for callback in self._on_ready:
-                await callback()
+            # Notify ready callbacks concurrently
+            results = await asyncio.gather(
+                *(callback() for callback in self._on_ready),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Ready callback error: %s", result)
             
-            print(f"🌐 OpenSim Bridge connected to {self.config.grid_name}")
+            logger.info("🌐 OpenSim Bridge connected to %s", self.config.grid_name)
             return True
             
         except Exception as e:
-            print(f"❌ OpenSim Bridge connection failed: {e}")
+            logger.error("❌ OpenSim Bridge connection failed: %s", e)
             return False
     
     async def disconnect(self):
@@ -112,8 +169,12 @@ class OpenSimBridge:
         if self.controller:
             await self.controller.stop()
         
+        if self.session:
+            await self.session.close()
+            self.session = None
+        
         self.connected = False
-        print("🔌 OpenSim Bridge disconnected")
+        logger.info("🔌 OpenSim Bridge disconnected")
     
     def on_ready(self, callback: Callable):
         """Register callback for when bridge is ready."""
@@ -137,7 +198,7 @@ class OpenSimBridge:
             return None
         
         # Determine names
-        first_name = name.split()[0] if " " in name else name
+        first_name = _first_name(name)
         last_name = self.config.bot_last_name
         
         # Check if we have credentials
@@ -145,7 +206,7 @@ class OpenSimBridge:
             creds = self.credentials[agent_id]
         else:
             # Create new bot account
-            print(f"📝 Creating OpenSim account for {first_name} {last_name}...")
+            logger.info("📝 Creating OpenSim account for %s %s...", first_name, last_name)
             
             account = await self.admin.create_bot_account(
                 bot_name=first_name,
@@ -158,7 +219,7 @@ class OpenSimBridge:
                     agent_id=agent_id,
                     first_name=account.first_name,
                     last_name=account.last_name,
-                    password=getattr(account, 'password', 'botpass123'),
+                    password=account.password or 'botpass123',
                     uuid=account.uuid
                 )
                 self.credentials[agent_id] = creds
@@ -191,7 +252,7 @@ class OpenSimBridge:
         )
         
         if success:
-            print(f"🤖 Agent spawned in OpenSim: {creds.first_name} {creds.last_name}")
+            logger.info("🤖 Agent spawned in OpenSim: %s %s", creds.first_name, creds.last_name)
             return bot
         
         return None
@@ -209,6 +270,13 @@ class OpenSimBridge:
             return None
         return self.controller.get_bot(agent_id)
     
+    def get_agent_id(self, avatar_uuid: str) -> Optional[str]:
+        """Map an OpenSim avatar UUID back to its ClawBots agent ID."""
+        if not self.controller:
+            return None
+        bot = self.controller.get_bot_by_uuid(avatar_uuid)
+        return bot.agent_id if bot else None
+    
     # ========== ACTIONS ==========
     
     async def move_agent(
@@ -284,27 +352,75 @@ class OpenSimBridge:
         
         - Syncs positions from ClawBots → OpenSim
         - Relays chat from ClawBots → OpenSim
+        
+        Runs as soon as a world movement event arrives, and makes a full
+        pass at least every SYNC_INTERVAL to catch moves that emit no
+        event (followers), however busy the event traffic is.
         """
+        last_full = time.monotonic()
         while self._running:
-            await asyncio.sleep(0.5)  # Sync interval
+            self._sync_wake.clear()
+            remaining = SYNC_INTERVAL - (time.monotonic() - last_full)
+            if remaining > 0:
+                try:
+                    async with asyncio.timeout(remaining):
+                        await self._sync_wake.wait()
+                except TimeoutError:
+                    pass
+            
+            now = time.monotonic()
+            full_pass = now - last_full >= SYNC_INTERVAL
+            if full_pass:
+                last_full = now
+            
+            # Several moves of one agent since the last pass collapse into
+            # a single sync to its latest position
+            self._pending_sync, pending = set(), self._pending_sync
             
             try:
-                await self._sync_positions()
+                await self._sync_positions(None if full_pass else pending)
+                self._sync_failures = 0
             except Exception as e:
-                print(f"Sync error: {e}")
+                # Back off exponentially instead of failing at full rate
+                self._sync_failures += 1
+                delay = min(SYNC_MAX_BACKOFF, SYNC_INTERVAL * 2 ** self._sync_failures)
+                logger.error("Sync error: %s (retrying in %.1fs)", e, delay)
+                await asyncio.sleep(delay)
     
-    async def _sync_positions(self):
-        """Sync agent positions from ClawBots to OpenSim."""
+    async def _on_world_event(self, event: Dict[str, Any]):
+        """World event handler: wake the sync loop when a bot's agent moves."""
+        if not self._running or event.get("type") not in SYNC_EVENT_TYPES:
+            return
+        
+        agent_id = event.get("agent_id")
+        if self.controller and agent_id in self.controller.bots:
+            self._pending_sync.add(agent_id)
+            self._sync_wake.set()
+    
+    async def _sync_positions(self, agent_ids: Optional[Set[str]] = None):
+        """
+        Sync agent positions from ClawBots to OpenSim.
+        
+        Checks only the given agents, or every online bot if None.
+        """
         if not self.config.sync_positions:
             return
         
         if not self.world or not self.controller:
             return
         
-        # Get all agents from world
-        for agent_id, bot in self.controller.bots.items():
-            if not bot.is_online:
-                continue
+        if agent_ids is None:
+            bots = self.controller.get_online_bots()
+        else:
+            bots = [
+                bot for bot in map(self.controller.get_bot, agent_ids)
+                if bot and bot.is_online
+            ]
+        
+        # Collect moves for every bot whose agent moved
+        moves = []
+        for bot in bots:
+            agent_id = bot.agent_id
             
             # Get ClawBots agent position
             agent = self.world.get_agent(agent_id)
@@ -313,18 +429,31 @@ class OpenSimBridge:
             
             # Check if position changed
             loc = agent.location
-            if hasattr(loc, 'x'):
-                dx = abs(bot.x - loc.x)
-                dy = abs(bot.y - loc.y)
+            has_xy, has_z = self._get_location_caps(loc)
+            if has_xy:
+                dx = bot.x - loc.x
+                dy = bot.y - loc.y
                 
                 # Only sync if moved significantly
-                if dx > 1.0 or dy > 1.0:
-                    await self.controller.move_bot(
+                if dx * dx + dy * dy > _SYNC_MIN_DISTANCE_SQ:
+                    moves.append(self.controller.move_bot(
                         agent_id,
                         loc.x,
                         loc.y,
-                        loc.z if hasattr(loc, 'z') else None
-                    )
+                        loc.z if has_z else None
+                    ))
+        
+        # Send them concurrently over the pooled session
+        if moves:
+            await asyncio.gather(*moves)
+    
+    def _get_location_caps(self, loc: Any) -> Tuple[bool, bool]:
+        """Which coordinates a location type has, probed once per type."""
+        caps = self._location_caps.get(type(loc))
+        if caps is None:
+            caps = (hasattr(loc, 'x'), hasattr(loc, 'z'))
+            self._location_caps[type(loc)] = caps
+        return caps
     
     async def relay_speech(self, agent_id: str, message: str, volume: str = "normal"):
         """Relay speech from ClawBots to OpenSim."""
@@ -341,20 +470,7 @@ class OpenSimBridge:
         if not self.config.sync_animations:
             return
         
-        # Map emote names to OpenSim animations
-        animation_map = {
-            "wave": "wave",
-            "nod": "nod",
-            "laugh": "laugh",
-            "dance": "dance1",
-            "sit": "sit",
-            "stand": "stand",
-            "bow": "bow",
-            "shrug": "shrug",
-            "think": "think"
-        }
-        
-        animation = animation_map.get(action.lower(), action)
+        animation = ANIMATION_MAP.get(action.lower(), action)
         await self.agent_animate(agent_id, animation)
     
     # ========== ADMIN ==========
@@ -380,18 +496,24 @@ class OpenSimBridge:
     # ========== STATUS ==========
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get bridge statistics."""
+        """
+        Get bridge statistics.
+        
+        The config part is read fresh each call; the per-bot list comes
+        from the controller's cached snapshot.
+        """
+        config = self.config
         controller_stats = self.controller.get_stats() if self.controller else {}
         
         return {
             "connected": self.connected,
-            "grid_name": self.config.grid_name,
-            "grid_url": self.config.grid_url,
-            "default_region": self.config.default_region,
+            "grid_name": config.grid_name,
+            "grid_url": config.grid_url,
+            "default_region": config.default_region,
             "sync_enabled": {
-                "positions": self.config.sync_positions,
-                "chat": self.config.sync_chat,
-                "animations": self.config.sync_animations
+                "positions": config.sync_positions,
+                "chat": config.sync_chat,
+                "animations": config.sync_animations
             },
             "bots": controller_stats.get("bots", []),
             "total_bots": controller_stats.get("total_bots", 0),
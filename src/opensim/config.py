@@ -7,11 +7,20 @@ Settings for Bhairav Sim integration.
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 from pathlib import Path
+import functools
 import json
 import os
+import threading
 
+# Prefer orjson for config files, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-@dataclass
+
+@dataclass(slots=True)
 class OpenSimConfig:
     """
     OpenSim Grid Configuration.
@@ -53,21 +62,15 @@ class OpenSimConfig:
     
     @classmethod
     def from_env(cls) -> "OpenSimConfig":
-        """Load config from environment variables."""
-        return cls(
-            grid_name=os.getenv("OPENSIM_GRID_NAME", "Bhairav Sim"),
-            grid_url=os.getenv("OPENSIM_GRID_URL", "http://localhost:9000"),
-            remote_admin_url=os.getenv("OPENSIM_ADMIN_URL", "http://localhost:9000"),
-            remote_admin_password=os.getenv("OPENSIM_ADMIN_PASSWORD", ""),
-            robust_url=os.getenv("OPENSIM_ROBUST_URL", "http://localhost:8002"),
-            default_region=os.getenv("OPENSIM_DEFAULT_REGION", "Bhairav"),
-        )
+        """Load config from environment variables (read once per process)."""
+        return cls(**_env_settings())
     
     @classmethod
     def from_file(cls, path: str) -> "OpenSimConfig":
         """Load config from JSON file."""
-        with open(path, 'r') as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
         return cls(**data)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -87,28 +90,50 @@ class OpenSimConfig:
     
     def save(self, path: str):
         """Save config to file."""
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        if HAS_ORJSON:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
+
+
+@functools.lru_cache(maxsize=1)
+def _env_settings() -> Dict[str, str]:
+    """Snapshot the OPENSIM_* environment variables."""
+    return {
+        "grid_name": os.getenv("OPENSIM_GRID_NAME", "Bhairav Sim"),
+        "grid_url": os.getenv("OPENSIM_GRID_URL", "http://localhost:9000"),
+        "remote_admin_url": os.getenv("OPENSIM_ADMIN_URL", "http://localhost:9000"),
+        "remote_admin_password": os.getenv("OPENSIM_ADMIN_PASSWORD", ""),
+        "robust_url": os.getenv("OPENSIM_ROBUST_URL", "http://localhost:8002"),
+        "default_region": os.getenv("OPENSIM_DEFAULT_REGION", "Bhairav"),
+    }
 
 
 # Default config instance
 _config: Optional[OpenSimConfig] = None
+_config_lock = threading.Lock()
 
 
 def get_opensim_config() -> OpenSimConfig:
     """Get the global OpenSim config."""
     global _config
     if _config is None:
-        # Try loading from file first
-        config_path = Path("opensim_config.json")
-        if config_path.exists():
-            _config = OpenSimConfig.from_file(str(config_path))
-        else:
-            _config = OpenSimConfig.from_env()
+        with _config_lock:
+            if _config is None:
+                # Try loading from file first
+                config_path = Path("opensim_config.json")
+                if config_path.exists():
+                    _config = OpenSimConfig.from_file(str(config_path))
+                else:
+                    _config = OpenSimConfig.from_env()
     return _config
 
 
-def set_opensim_config(config: OpenSimConfig):
-    """Set the global OpenSim config."""
+def set_opensim_config(config: Optional[OpenSimConfig]):
+    """Set the global OpenSim config (None reloads it on next access)."""
     global _config
-    _config = config
+    with _config_lock:
+        _env_settings.cache_clear()
+        _config = config
@@ -5,16 +5,73 @@ XML-RPC interface for OpenSim grid administration.
 Used for creating bot accounts, teleporting, etc.
 """
 
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape
 import xmlrpc.client
-import hashlib
+import functools
+import secrets
 import uuid
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
+import aiohttp
 
-@dataclass
+from .bot_controller import create_grid_session
+
+
+BOT_EMAIL_DOMAIN = "clawbots.local"
+
+_XML_HEADERS = {"Content-Type": "text/xml"}
+_ADMIN_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=2)
+
+# RemoteAdmin methods all take a single struct param, so each request is
+# a fixed head per method + struct members + a fixed tail
+_ENVELOPE_TAIL = "</struct></value></param></params></methodCall>"
+
+# XML-RPC value encoders keyed by exact type (so bool never hits int)
+_MARSHAL = {
+    str: lambda v: f"<string>{escape(v)}</string>",
+    bool: lambda v: f"<boolean>{int(v)}</boolean>",
+    int: lambda v: f"<int>{v}</int>",
+    float: lambda v: f"<double>{v!r}</double>",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _envelope_head(method: str) -> str:
+    """XML-RPC request prefix for a method, built once per method name."""
+    return (
+        "<?xml version='1.0'?><methodCall>"
+        f"<methodName>{escape(method)}</methodName>"
+        "<params><param><value><struct>"
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _bot_email(first_name: str, last_name: str, domain: str = BOT_EMAIL_DOMAIN) -> str:
+    """Placeholder email for a bot account."""
+    return f"{first_name.lower()}.{last_name.lower()}@{domain}"
+
+
+def _marshal_params(params: Dict[str, Any]) -> Optional[str]:
+    """
+    Encode a flat struct's members.
+    
+    Returns None if a value isn't a scalar, so the caller can fall back
+    to xmlrpc.client for nested data.
+    """
+    parts = []
+    for key, value in params.items():
+        encode = _MARSHAL.get(type(value))
+        if encode is None:
+            return None
+        parts.append(
+            f"<member><name>{escape(key)}</name><value>{encode(value)}</value></member>"
+        )
+    return "".join(parts)
+
+
+@dataclass(slots=True)
 class UserAccount:
     """OpenSim user account info."""
     uuid: str
@@ -22,6 +79,7 @@ class UserAccount:
     last_name: str
     email: str
     created: bool = False
+    password: Optional[str] = field(default=None, repr=False)  # Known only for accounts we created
     
     @property
     def full_name(self) -> str:
@@ -40,38 +98,58 @@ class RemoteAdminClient:
     - Grid administration
     """
     
-    def __init__(self, url: str, password: str):
+    def __init__(
+        self,
+        url: str,
+        password: str,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         self.url = url
         self.password = password
-        self._proxy: Optional[xmlrpc.client.ServerProxy] = None
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._password_member = _marshal_params({"password": password})
+        # Keep-alive HTTP session; shared when the caller passes one in
+        self._session = session
+        self._owns_session = session is None
     
     @property
-    def proxy(self) -> xmlrpc.client.ServerProxy:
-        """Get XML-RPC proxy (lazy init)."""
-        if self._proxy is None:
-            self._proxy = xmlrpc.client.ServerProxy(self.url)
-        return self._proxy
+    def session(self) -> aiohttp.ClientSession:
+        """Get HTTP session (lazy init)."""
+        if self._session is None or self._session.closed:
+            self._session = create_grid_session()
+            self._owns_session = True
+        return self._session
+    
+    async def close(self):
+        """Close the HTTP session if this client created it."""
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
-    def _call(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Make an XML-RPC call."""
-        params["password"] = self.password
+    async def _call(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Make an XML-RPC call over the pooled session."""
         try:
-            result = getattr(self.proxy, method)(params)
+            members = _marshal_params(params)
+            if members is None:
+                body = xmlrpc.client.dumps(
+                    ({**params, "password": self.password},), methodname=method
+                )
+            else:
+                body = (
+                    _envelope_head(method) + members
+                    + self._password_member + _ENVELOPE_TAIL
+                )
+            async with self.session.post(
+                self.url,
+                data=body.encode(),
+                headers=_XML_HEADERS,
+                timeout=_ADMIN_TIMEOUT
+            ) as resp:
+                resp.raise_for_status()
+                (result,), _ = xmlrpc.client.loads(await resp.read())
             return result
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    async def _async_call(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Make async XML-RPC call."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor,
-            self._call,
-            method,
-            params
-        )
-    
     # ========== USER MANAGEMENT ==========
     
     async def create_user(
@@ -100,7 +178,7 @@ class RemoteAdminClient:
             "user_firstname": first_name,
             "user_lastname": last_name,
             "user_password": password,
-            "user_email": email or f"{first_name.lower()}.{last_name.lower()}@clawbots.local",
+            "user_email": email or _bot_email(first_name, last_name),
             "start_region_x": int(start_pos_x),
             "start_region_y": int(start_pos_y),
         }
@@ -108,7 +186,7 @@ class RemoteAdminClient:
         if start_region:
             params["start_region_name"] = start_region
         
-        result = await self._async_call("admin_create_user", params)
+        result = await self._call("admin_create_user", params)
         
         return UserAccount(
             uuid=result.get("user_uuid", user_uuid),
@@ -120,7 +198,7 @@ class RemoteAdminClient:
     
     async def user_exists(self, first_name: str, last_name: str) -> bool:
         """Check if a user account exists."""
-        result = await self._async_call("admin_exists_user", {
+        result = await self._call("admin_exists_user", {
             "user_firstname": first_name,
             "user_lastname": last_name
         })
@@ -136,7 +214,7 @@ class RemoteAdminClient:
         Authenticate a user and return session token.
         Returns None if auth fails.
         """
-        result = await self._async_call("admin_authenticate_user", {
+        result = await self._call("admin_authenticate_user", {
             "user_firstname": first_name,
             "user_lastname": last_name,
             "user_password": password
@@ -150,7 +228,7 @@ class RemoteAdminClient:
     
     async def get_region_info(self, region_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a region."""
-        result = await self._async_call("admin_region_query", {
+        result = await self._call("admin_region_query", {
             "region_name": region_name
         })
         
@@ -166,7 +244,7 @@ class RemoteAdminClient:
     
     async def list_regions(self) -> List[Dict[str, Any]]:
         """List all regions in the grid."""
-        result = await self._async_call("admin_region_list", {})
+        result = await self._call("admin_region_list", {})
         
         if result.get("success"):
             return result.get("regions", [])
@@ -174,7 +252,7 @@ class RemoteAdminClient:
     
     async def restart_region(self, region_name: str) -> bool:
         """Restart a region."""
-        result = await self._async_call("admin_region_restart", {
+        result = await self._call("admin_region_restart", {
             "region_name": region_name
         })
         return result.get("success", False)
@@ -191,7 +269,7 @@ class RemoteAdminClient:
         pos_z: float = 25.0
     ) -> bool:
         """Teleport a user to a region."""
-        result = await self._async_call("admin_teleport_user", {
+        result = await self._call("admin_teleport_user", {
             "user_firstname": first_name,
             "user_lastname": last_name,
             "region_name": region_name,
@@ -208,7 +286,7 @@ class RemoteAdminClient:
         message: str = "Kicked by admin"
     ) -> bool:
         """Kick a user from the grid."""
-        result = await self._async_call("admin_kick_user", {
+        result = await self._call("admin_kick_user", {
             "user_firstname": first_name,
             "user_lastname": last_name,
             "message": message
@@ -219,14 +297,14 @@ class RemoteAdminClient:
     
     async def broadcast_message(self, message: str) -> bool:
         """Broadcast a message to all users in the grid."""
-        result = await self._async_call("admin_broadcast", {
+        result = await self._call("admin_broadcast", {
             "message": message
         })
         return result.get("success", False)
     
     async def region_message(self, region_name: str, message: str) -> bool:
         """Send a message to all users in a region."""
-        result = await self._async_call("admin_region_message", {
+        result = await self._call("admin_region_message", {
             "region_name": region_name,
             "message": message
         })
@@ -237,7 +315,7 @@ class RemoteAdminClient:
     async def get_grid_status(self) -> Dict[str, Any]:
         """Get overall grid status."""
         try:
-            result = await self._async_call("admin_get_status", {})
+            result = await self._call("admin_get_status", {})
             return {
                 "online": True,
                 "regions": result.get("region_count", 0),
@@ -250,7 +328,7 @@ class RemoteAdminClient:
     async def ping(self) -> bool:
         """Simple ping to check if RemoteAdmin is responding."""
         try:
-            result = await self._async_call("admin_ping", {})
+            result = await self._call("admin_ping", {})
             return result.get("success", True)  # ping usually just returns
         except:
             return False
@@ -275,9 +353,7 @@ class RemoteAdminClient:
             UserAccount with credentials
         """
         # Generate a secure password for the bot
-        password = hashlib.sha256(
-            f"{bot_name}{bot_last_name}{uuid.uuid4()}".encode()
-        ).hexdigest()[:16]
+        password = secrets.token_hex(8)
         
         account = await self.create_user(
             first_name=bot_name,
@@ -287,7 +363,7 @@ class RemoteAdminClient:
         )
         
         # Store password in account for later use
-        account.__dict__["password"] = password
+        account.password = password
         
         return account
     
@@ -308,9 +384,61 @@ class RemoteAdminClient:
                 uuid="",  # Unknown
                 first_name=bot_name,
                 last_name=bot_last_name,
-                email=f"{bot_name.lower()}.{bot_last_name.lower()}@clawbots.local",
+                email=_bot_email(bot_name, bot_last_name),
                 created=False
             )
         
         # Create new account
         return await self.create_bot_account(bot_name, bot_last_name)
+    
+    async def ensure_bot_accounts(
+        self,
+        names: List[Tuple[str, str]]
+    ) -> List[UserAccount]:
+        """
+        Ensure many bot accounts exist in as few round trips as possible.
+        
+        Args:
+            names: (first_name, last_name) pairs
+            
+        Returns:
+            One UserAccount per pair, in order
+        """
+        if not names:
+            return []
+        
+        result = await self._call("admin_exists_users", {
+            "users": [
+                {"user_firstname": first, "user_lastname": last}
+                for first, last in names
+            ]
+        })
+        exists = result.get("exists") if result.get("success") else None
+        
+        if not isinstance(exists, list) or len(exists) != len(names):
+            # Grid has no bulk lookup: pipeline per-bot calls over the pool
+            return list(await asyncio.gather(*(
+                self.ensure_bot_account(first, last) for first, last in names
+            )))
+        
+        accounts: List[Optional[UserAccount]] = [None] * len(names)
+        missing = []
+        for i, ((first, last), found) in enumerate(zip(names, exists)):
+            if found:
+                accounts[i] = UserAccount(
+                    uuid="",  # Unknown
+                    first_name=first,
+                    last_name=last,
+                    email=_bot_email(first, last),
+                    created=False
+                )
+            else:
+                missing.append(i)
+        
+        created = await asyncio.gather(*(
+            self.create_bot_account(*names[i]) for i in missing
+        ))
+        for i, account in zip(missing, created):
+            accounts[i] = account
+        
+        return accounts
@@ -5,13 +5,22 @@ Agent registration and setup utilities.
 """
 
 from typing import Optional, Dict, List, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 import json
+import sys
 import yaml
 
+# libyaml's C loader when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """Intern strings so values repeated across templates share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class AvatarSetup:
     """Avatar configuration for registration."""
     model: str = "humanoid_v2"
@@ -28,7 +37,7 @@ class AvatarSetup:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSetup:
     """Complete agent setup configuration."""
     name: str
@@ -51,28 +60,32 @@ class AgentSetup:
     @classmethod
     def from_yaml(cls, yaml_str: str) -> "AgentSetup":
         """Load agent setup from YAML string."""
-        data = yaml.safe_load(yaml_str)
+        return cls.from_dict(yaml.load(yaml_str, Loader=_YAML_LOADER))
+    
+    @classmethod
+    def from_yaml_file(cls, path: str) -> "AgentSetup":
+        """Load agent setup from YAML file."""
+        with open(path, 'rb') as f:
+            return cls.from_dict(yaml.load(f, Loader=_YAML_LOADER))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgentSetup":
+        """Build agent setup from parsed YAML data."""
         avatar_data = data.get("avatar", {})
         avatar = AvatarSetup(
-            model=avatar_data.get("model", "humanoid_v2"),
+            model=_intern(avatar_data.get("model", "humanoid_v2")),
             height=avatar_data.get("height", 1.8),
-            clothing=avatar_data.get("clothing", "casual"),
-            accessories=avatar_data.get("accessories", [])
+            clothing=_intern(avatar_data.get("clothing", "casual")),
+            accessories=[_intern(a) for a in avatar_data.get("accessories", [])]
         )
         return cls(
             name=data.get("name", "Agent"),
             description=data.get("description", ""),
             avatar=avatar,
-            default_region=data.get("default_region", "main"),
+            default_region=_intern(data.get("default_region", "main")),
             skills_map=data.get("skills_map", {}),
-            tags=data.get("tags", [])
+            tags=[_intern(t) for t in data.get("tags", [])]
         )
-    
-    @classmethod
-    def from_yaml_file(cls, path: str) -> "AgentSetup":
-        """Load agent setup from YAML file."""
-        with open(path, 'r') as f:
-            return cls.from_yaml(f.read())
 
 
 class PortalConfig:
@@ -82,6 +95,11 @@ class PortalConfig:
     Handles agent registration templates and validation.
     """
     
+    # Validation limits
+    _VALID_REGIONS = frozenset({"main", "sandbox", "market", "library"})
+    _NAME_MIN, _NAME_MAX = 2, 32
+    _HEIGHT_MIN, _HEIGHT_MAX = 0.5, 3.0
+    
     def __init__(self):
         self.templates: Dict[str, AgentSetup] = {}
         self._init_default_templates()
@@ -139,18 +157,20 @@ class PortalConfig:
         """Validate an agent setup. Returns list of errors."""
         errors = []
         
-        if not setup.name or len(setup.name) < 2:
-            errors.append("Name must be at least 2 characters")
+        name_len = len(setup.name) if setup.name else 0
+        if name_len < self._NAME_MIN:
+            errors.append(f"Name must be at least {self._NAME_MIN} characters")
         
-        if len(setup.name) > 32:
-            errors.append("Name must be 32 characters or less")
+        if name_len > self._NAME_MAX:
+            errors.append(f"Name must be {self._NAME_MAX} characters or less")
         
-        valid_regions = ["main", "sandbox", "market", "library"]
-        if setup.default_region not in valid_regions:
+        if setup.default_region not in self._VALID_REGIONS:
             errors.append(f"Invalid region: {setup.default_region}")
         
-        if setup.avatar.height < 0.5 or setup.avatar.height > 3.0:
-            errors.append("Avatar height must be between 0.5 and 3.0")
+        if not self._HEIGHT_MIN <= setup.avatar.height <= self._HEIGHT_MAX:
+            errors.append(
+                f"Avatar height must be between {self._HEIGHT_MIN} and {self._HEIGHT_MAX}"
+            )
         
         return errors
     
@@ -165,14 +185,19 @@ class PortalConfig:
         if not template:
             return None
         
-        # Create copy with overrides
+        # Create copy with overrides; mutable parts are copied so edits to
+        # the new setup never reach the shared template
+        avatar = template.avatar
         setup = AgentSetup(
             name=custom_name or template.name,
             description=overrides.get("description", template.description),
-            avatar=template.avatar,
+            avatar=replace(avatar, accessories=avatar.accessories.copy()),
             default_region=overrides.get("default_region", template.default_region),
-            skills_map=overrides.get("skills_map", template.skills_map.copy()),
-            tags=overrides.get("tags", template.tags.copy())
+            skills_map=(
+                overrides["skills_map"] if "skills_map" in overrides
+                else template.skills_map.copy()
+            ),
+            tags=overrides["tags"] if "tags" in overrides else template.tags.copy()
         )
         
         return setup
@@ -4,7 +4,7 @@ ClawBots Registry - Agent Authentication & Identity
 Manages agent registration, authentication, and permissions.
 """
 
-from .auth import AuthManager
+from .auth import AuthManager, ActionKind
 from .agents import AgentRegistry
 
-__all__ = ["AuthManager", "AgentRegistry"]
+__all__ = ["AuthManager", "ActionKind", "AgentRegistry"]
@@ -6,12 +6,56 @@ Manages agent registration, configuration, and lookup.
 
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass, field
-from datetime import datetime
-import json
-import uuid
+from datetime import datetime, timezone
+import asyncio
+import copy
+import secrets
+import string
+import sys
+import time
 
 
-@dataclass
+# Deletes every ASCII character except a-z/0-9 when building agent IDs
+# (non-ASCII is stripped by an ascii/ignore round trip first)
+_ID_KEEP = frozenset(string.ascii_lowercase + string.digits)
+_ID_DELETE_TABLE = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if chr(i) not in _ID_KEEP)
+)
+
+# Seconds to coalesce registry writes before flushing them to storage
+SAVE_DELAY = 0.5
+
+
+def _to_epoch(value: Any) -> Optional[float]:
+    """Epoch seconds from a stored timestamp (ISO string, or epoch float)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        dt = datetime.fromisoformat(value)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)  # Legacy values were utcnow()
+        return dt.timestamp()
+    return float(value)
+
+
+def _to_iso(epoch: Optional[float]) -> Optional[str]:
+    """ISO 8601 UTC string for epoch seconds, as stored and served."""
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat()
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings so values repeated across agents share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _trigrams(text: str) -> set[str]:
+    """All 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass(slots=True)
 class AvatarConfig:
     """Avatar appearance configuration."""
     model: str = "humanoid_v2"
@@ -24,7 +68,7 @@ class AvatarConfig:
     accessories: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Complete agent configuration."""
     agent_id: str
@@ -44,13 +88,25 @@ class AgentConfig:
     # Metadata
     description: str = ""
     tags: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    last_seen: Optional[datetime] = None
+    created_at: float = field(default_factory=time.time)  # Epoch seconds
+    last_seen: Optional[float] = None  # Epoch seconds
     
     # Stats
     total_time_online: float = 0.0  # seconds
     total_messages: int = 0
     total_actions: int = 0
+    
+    @property
+    def created_at_dt(self) -> datetime:
+        """created_at as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.created_at, tz=timezone.utc)
+    
+    @property
+    def last_seen_dt(self) -> Optional[datetime]:
+        """last_seen as an aware UTC datetime."""
+        if self.last_seen is None:
+            return None
+        return datetime.fromtimestamp(self.last_seen, tz=timezone.utc)
 
 
 class AgentRegistry:
@@ -64,6 +120,22 @@ class AgentRegistry:
     def __init__(self, storage=None):
         self.storage = storage or InMemoryAgentStorage()
         self.agents: Dict[str, AgentConfig] = {}
+        
+        # Pending writes, flushed in one batch per SAVE_DELAY window
+        self._dirty: set[str] = set()
+        self._deleted: set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        
+        # Serialized form per agent, dropped whenever the agent changes
+        self._dict_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Name search index: lowercased names and trigram -> agent_ids
+        self._name_lower: Dict[str, str] = {}
+        self._name_index: Dict[str, set[str]] = {}
+        
+        # Owner -> agent_ids
+        self._by_owner: Dict[Optional[str], set[str]] = {}
+        
         self._load_agents()
     
     def _load_agents(self) -> None:
@@ -72,12 +144,90 @@ class AgentRegistry:
         for agent_data in stored:
             config = self._dict_to_config(agent_data)
             self.agents[config.agent_id] = config
+            self._index_name(config.agent_id, config.name)
+            self._index_owner(config.agent_id, config.owner_id)
     
     def _save_agents(self) -> None:
-        """Save agents to storage."""
-        data = [self._config_to_dict(c) for c in self.agents.values()]
+        """Save all agents to storage."""
+        data = [self._agent_dict(aid) for aid in self.agents]
         self.storage.save_agents(data)
     
+    def _index_name(self, agent_id: str, name: str) -> None:
+        """Add an agent's name to the search index."""
+        name_lower = name.lower()
+        self._name_lower[agent_id] = name_lower
+        for gram in _trigrams(name_lower):
+            self._name_index.setdefault(gram, set()).add(agent_id)
+    
+    def _unindex_name(self, agent_id: str) -> None:
+        """Remove an agent's name from the search index."""
+        name_lower = self._name_lower.pop(agent_id, None)
+        if name_lower is None:
+            return
+        for gram in _trigrams(name_lower):
+            ids = self._name_index.get(gram)
+            if ids is not None:
+                ids.discard(agent_id)
+                if not ids:
+                    del self._name_index[gram]
+    
+    def _index_owner(self, agent_id: str, owner_id: Optional[str]) -> None:
+        """Add an agent to its owner's bucket."""
+        self._by_owner.setdefault(owner_id, set()).add(agent_id)
+    
+    def _unindex_owner(self, agent_id: str, owner_id: Optional[str]) -> None:
+        """Remove an agent from its owner's bucket."""
+        ids = self._by_owner.get(owner_id)
+        if ids is not None:
+            ids.discard(agent_id)
+            if not ids:
+                del self._by_owner[owner_id]
+    
+    def _mark_dirty(self, agent_id: str, deleted: bool = False) -> None:
+        """Queue an agent for the next flush."""
+        self._dict_cache.pop(agent_id, None)
+        if deleted:
+            self._dirty.discard(agent_id)
+            self._deleted.add(agent_id)
+        else:
+            self._deleted.discard(agent_id)
+            self._dirty.add(agent_id)
+        
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts, tests): write through immediately
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(SAVE_DELAY, self.flush)
+    
+    def flush(self) -> None:
+        """Write pending agent changes to storage. Call on shutdown."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._dirty and not self._deleted:
+            return
+        
+        if not hasattr(self.storage, "upsert_agents"):
+            # Storage without incremental writes gets the full table
+            self._dirty.clear()
+            self._deleted.clear()
+            self._save_agents()
+            return
+        
+        if self._deleted:
+            self.storage.delete_agents(list(self._deleted))
+            self._deleted.clear()
+        if self._dirty:
+            self.storage.upsert_agents([
+                self._agent_dict(aid)
+                for aid in self._dirty if aid in self.agents
+            ])
+            self._dirty.clear()
+    
     # ========== REGISTRATION ==========
     
     def register(
@@ -99,7 +249,7 @@ class AgentRegistry:
         if avatar:
             for key, value in avatar.items():
                 if hasattr(avatar_config, key):
-                    setattr(avatar_config, key, value)
+                    setattr(avatar_config, key, _intern(value))
         
         config = AgentConfig(
             agent_id=agent_id,
@@ -111,24 +261,29 @@ class AgentRegistry:
         )
         
         self.agents[agent_id] = config
-        self._save_agents()
+        self._index_name(agent_id, name)
+        self._index_owner(agent_id, owner_id)
+        self._mark_dirty(agent_id)
         
         return config
     
     def unregister(self, agent_id: str) -> bool:
         """Remove an agent from the registry."""
         if agent_id in self.agents:
-            del self.agents[agent_id]
-            self._save_agents()
+            config = self.agents.pop(agent_id)
+            self._unindex_name(agent_id)
+            self._unindex_owner(agent_id, config.owner_id)
+            self._mark_dirty(agent_id, deleted=True)
             return True
         return False
     
     def _generate_agent_id(self, name: str) -> str:
         """Generate a unique agent ID."""
         # Sanitize name
-        safe_name = "".join(c for c in name.lower() if c.isalnum())[:20]
+        ascii_name = name.lower().encode("ascii", "ignore").decode("ascii")
+        safe_name = ascii_name.translate(_ID_DELETE_TABLE)[:20]
         # Add unique suffix
-        suffix = uuid.uuid4().hex[:8]
+        suffix = secrets.token_hex(4)
         return f"{safe_name}-{suffix}"
     
     # ========== LOOKUP ==========
@@ -140,17 +295,27 @@ class AgentRegistry:
     def get_by_name(self, name: str) -> List[AgentConfig]:
         """Find agents by name (partial match)."""
         name_lower = name.lower()
+        if len(name_lower) < 3:
+            # Too short for trigrams: scan the cached lowercased names
+            return [
+                self.agents[aid] for aid, n in self._name_lower.items()
+                if name_lower in n
+            ]
+        
+        # Candidates must contain every trigram of the query
+        grams = sorted(
+            (self._name_index.get(g, set()) for g in _trigrams(name_lower)),
+            key=len
+        )
+        candidates = grams[0].intersection(*grams[1:])
         return [
-            a for a in self.agents.values()
-            if name_lower in a.name.lower()
+            self.agents[aid] for aid in candidates
+            if name_lower in self._name_lower[aid]
         ]
     
     def get_by_owner(self, owner_id: str) -> List[AgentConfig]:
         """Get all agents owned by a specific owner."""
-        return [
-            a for a in self.agents.values()
-            if a.owner_id == owner_id
-        ]
+        return [self.agents[aid] for aid in self._by_owner.get(owner_id, ())]
     
     def get_all(self) -> List[AgentConfig]:
         """Get all registered agents."""
@@ -172,6 +337,8 @@ class AgentRegistry:
             return None
         
         config = self.agents[agent_id]
+        old_name = config.name
+        old_owner = config.owner_id
         
         for key, value in updates.items():
             if key == "avatar" and isinstance(value, dict):
@@ -181,15 +348,25 @@ class AgentRegistry:
             elif hasattr(config, key):
                 setattr(config, key, value)
         
-        self._save_agents()
+        if config.name != old_name:
+            self._unindex_name(agent_id)
+            self._index_name(agent_id, config.name)
+        if config.owner_id != old_owner:
+            self._unindex_owner(agent_id, old_owner)
+            self._index_owner(agent_id, config.owner_id)
+        
+        self._mark_dirty(agent_id)
         return config
     
     def get_agent_config(self, agent_id: str) -> Optional[Dict[str, Any]]:
-        """Get agent config as dictionary (for MCP)."""
-        config = self.get(agent_id)
-        if not config:
+        """Get agent config as dictionary (for MCP).
+        
+        Returns a copy: callers keep and modify parts of it (e.g. the
+        avatar dict), which must not leak into the cached form.
+        """
+        if agent_id not in self.agents:
             return None
-        return self._config_to_dict(config)
+        return copy.deepcopy(self._agent_dict(agent_id))
     
     def update_stats(
         self,
@@ -204,11 +381,30 @@ class AgentRegistry:
             config.total_messages += messages
             config.total_actions += actions
             config.total_time_online += time_online
-            config.last_seen = datetime.utcnow()
-            self._save_agents()
+            config.last_seen = time.time()
+            
+            cached = self._dict_cache.get(agent_id)
+            self._mark_dirty(agent_id)
+            if cached is not None:
+                # Only the counters changed: patch a copy instead of rebuilding
+                self._dict_cache[agent_id] = {
+                    **cached,
+                    "last_seen": _to_iso(config.last_seen),
+                    "total_time_online": config.total_time_online,
+                    "total_messages": config.total_messages,
+                    "total_actions": config.total_actions
+                }
     
     # ========== SERIALIZATION ==========
     
+    def _agent_dict(self, agent_id: str) -> Dict[str, Any]:
+        """Serialized agent config, reused until the agent changes (shared)."""
+        data = self._dict_cache.get(agent_id)
+        if data is None:
+            data = self._config_to_dict(self.agents[agent_id])
+            self._dict_cache[agent_id] = data
+        return data
+    
     def _config_to_dict(self, config: AgentConfig) -> Dict[str, Any]:
         """Convert AgentConfig to dictionary."""
         return {
@@ -230,8 +426,8 @@ class AgentRegistry:
             "skills_map": config.skills_map,
             "description": config.description,
             "tags": config.tags,
-            "created_at": config.created_at.isoformat(),
-            "last_seen": config.last_seen.isoformat() if config.last_seen else None,
+            "created_at": _to_iso(config.created_at),
+            "last_seen": _to_iso(config.last_seen),
             "total_time_online": config.total_time_online,
             "total_messages": config.total_messages,
             "total_actions": config.total_actions
@@ -241,14 +437,14 @@ class AgentRegistry:
         """Convert dictionary to AgentConfig."""
         avatar_data = data.get("avatar", {})
         avatar = AvatarConfig(
-            model=avatar_data.get("model", "humanoid_v2"),
+            model=_intern(avatar_data.get("model", "humanoid_v2")),
             height=avatar_data.get("height", 1.8),
-            body_type=avatar_data.get("body_type", "average"),
-            skin_tone=avatar_data.get("skin_tone", "medium"),
-            hair_style=avatar_data.get("hair_style", "default"),
-            hair_color=avatar_data.get("hair_color", "brown"),
-            clothing=avatar_data.get("clothing", "casual"),
-            accessories=avatar_data.get("accessories", [])
+            body_type=_intern(avatar_data.get("body_type", "average")),
+            skin_tone=_intern(avatar_data.get("skin_tone", "medium")),
+            hair_style=_intern(avatar_data.get("hair_style", "default")),
+            hair_color=_intern(avatar_data.get("hair_color", "brown")),
+            clothing=_intern(avatar_data.get("clothing", "casual")),
+            accessories=[_intern(a) for a in avatar_data.get("accessories", [])]
         )
         
         return AgentConfig(
@@ -256,13 +452,13 @@ class AgentRegistry:
             name=data["name"],
             owner_id=data.get("owner_id"),
             avatar=avatar,
-            default_region=data.get("default_region", "main"),
+            default_region=_intern(data.get("default_region", "main")),
             home_location=data.get("home_location"),
             skills_map=data.get("skills_map", {}),
             description=data.get("description", ""),
-            tags=data.get("tags", []),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.utcnow(),
-            last_seen=datetime.fromisoformat(data["last_seen"]) if data.get("last_seen") else None,
+            tags=[_intern(t) for t in data.get("tags", [])],
+            created_at=_to_epoch(data.get("created_at")) or time.time(),
+            last_seen=_to_epoch(data.get("last_seen")),
             total_time_online=data.get("total_time_online", 0.0),
             total_messages=data.get("total_messages", 0),
             total_actions=data.get("total_actions", 0)
@@ -273,10 +469,18 @@ class InMemoryAgentStorage:
     """Simple in-memory storage for development."""
     
     def __init__(self):
-        self.agents = []
+        self.agents: Dict[str, Dict[str, Any]] = {}
     
     def load_agents(self) -> List[Dict[str, Any]]:
-        return self.agents
+        return list(self.agents.values())
     
     def save_agents(self, agents: List[Dict[str, Any]]) -> None:
-        self.agents = agents
+        self.agents = {a["agent_id"]: a for a in agents}
+    
+    def upsert_agents(self, agents: List[Dict[str, Any]]) -> None:
+        for a in agents:
+            self.agents[a["agent_id"]] = a
+    
+    def delete_agents(self, agent_ids: List[str]) -> None:
+        for agent_id in agent_ids:
+            self.agents.pop(agent_id, None)
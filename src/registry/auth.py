@@ -4,39 +4,194 @@ ClawBots Auth Manager
 Handles agent authentication, tokens, and permissions.
 """
 
-from typing import Optional, Dict, List, Any
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from typing import Optional, Dict, List, Any, Iterable, Union
+from collections import deque
+from dataclasses import dataclass, field, InitVar
+from itertools import islice
+from operator import attrgetter
+from datetime import datetime, timezone
+from enum import IntEnum
 import secrets
 import hashlib
+import hmac
 import json
+import threading
+import time
 
+from timeutil import utc_iso_now
 
-@dataclass
+
+# hashlib's sha256 is OpenSSL's when CPython is linked against it, which
+# dispatches to SHA-NI / ARMv8 SHA2 instructions on CPUs that have them.
+# A one-shot call is used deliberately: for single-block tokens, copying a
+# prepared sha256() prototype and updating it measured no faster.
+_sha256 = hashlib.sha256
+
+
+# Audit events kept by InMemoryStorage before the oldest are overwritten
+EVENT_LOG_CAPACITY = 10_000
+
+# Rate limits are per minute, counted over a sliding window of buckets
+RATE_WINDOW = 60
+RATE_BUCKETS = 6
+_BUCKET_SECONDS = RATE_WINDOW // RATE_BUCKETS
+DEFAULT_RATE_LIMIT = 30  # For action types without their own limit
+
+
+class ActionKind(IntEnum):
+    """Rate-limited action types; values index the rate counters."""
+    MESSAGES = 0
+    ACTIONS = 1
+    MOVES = 2
+
+
+# Reader for each kind's AgentPermissions limit, indexed by ActionKind
+_RATE_LIMIT_OF = (
+    attrgetter("rate_limit_messages"),
+    attrgetter("rate_limit_actions"),
+    attrgetter("rate_limit_moves"),
+)
+
+# Counter index shared by every action_type string that isn't an
+# ActionKind name, limited together by DEFAULT_RATE_LIMIT
+_OTHER = len(ActionKind)
+
+# action_type string -> counter index
+_KIND: Dict[str, int] = {kind.name.lower(): kind for kind in ActionKind}
+
+
+def _kind_of(action_type: str) -> int:
+    return _KIND.get(action_type, _OTHER)
+
+
+class RateWindow:
+    """
+    Sliding one-minute action counters for one agent.
+    
+    Every action kind is a column of RATE_BUCKETS counts over one shared
+    row of bucket epochs, so recycling a bucket clears all kinds at once.
+    """
+    
+    __slots__ = ("counts", "epochs")
+    
+    def __init__(self):
+        # Per-bucket counts, indexed by ActionKind, then the shared _OTHER slot
+        self.counts: List[List[int]] = [[0] * RATE_BUCKETS for _ in range(_OTHER + 1)]
+        self.epochs = [-1] * RATE_BUCKETS  # Bucket number each slot holds
+    
+    def add(self, kind: int, now_s: int) -> None:
+        epoch = now_s // _BUCKET_SECONDS
+        i = epoch % RATE_BUCKETS
+        counts = self.counts
+        if self.epochs[i] != epoch:
+            # Slot still holds an expired bucket: recycle it
+            self.epochs[i] = epoch
+            for column in counts:
+                column[i] = 0
+        counts[kind][i] += 1
+    
+    def total(self, kind: int, now_s: int) -> int:
+        column = self.counts[kind]
+        oldest = now_s // _BUCKET_SECONDS - RATE_BUCKETS + 1
+        return sum(c for c, e in zip(column, self.epochs) if e >= oldest)
+    
+    def is_stale(self, now_s: int) -> bool:
+        """True once every bucket has left the window (all counts expired)."""
+        return max(self.epochs) < now_s // _BUCKET_SECONDS - RATE_BUCKETS + 1
+
+
+def _now_us() -> int:
+    """Current UTC time as integer epoch microseconds."""
+    return time.time_ns() // 1000
+
+
+def _to_us(dt: datetime) -> int:
+    """Epoch microseconds for a datetime (naive values are UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1_000_000)
+
+
+def _from_us(us: int) -> datetime:
+    """Aware UTC datetime for epoch microseconds."""
+    return datetime.fromtimestamp(us / 1_000_000, tz=timezone.utc)
+
+
+def _hash_token(token: str) -> bytes:
+    """Hash a token for secure storage (raw 32-byte digest)."""
+    return _sha256(token.encode()).digest()
+
+
+@dataclass(slots=True)
 class AgentToken:
     """Authentication token for an agent."""
     agent_id: str
-    token_hash: str
-    created_at: datetime
-    expires_at: datetime
-    scopes: List[str] = field(default_factory=list)
+    token_hash: bytes  # Raw SHA-256 digest
+    created_at_us: int  # Epoch microseconds
+    expires_at_us: int  # Epoch microseconds
+    scopes: frozenset = field(default_factory=frozenset)
+    
+    def __post_init__(self):
+        self.scopes = frozenset(self.scopes)
+    
+    @property
+    def created_at(self) -> datetime:
+        return _from_us(self.created_at_us)
+    
+    @property
+    def expires_at(self) -> datetime:
+        return _from_us(self.expires_at_us)
     
     def is_valid(self) -> bool:
-        return datetime.utcnow() < self.expires_at
+        return _now_us() < self.expires_at_us
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentPermissions:
     """Permissions for an agent."""
     agent_id: str
-    allowed_regions: List[str] = field(default_factory=lambda: ["main"])
+    allowed_regions: InitVar[Optional[Iterable[str]]] = None  # Default {"main"}
+    all_regions: bool = False  # "*" grant
     can_teleport: bool = True
     can_private_message: bool = True
     can_use_objects: bool = True
     rate_limit_messages: int = 10  # per minute
     rate_limit_actions: int = 30   # per minute
     rate_limit_moves: int = 60     # per minute
-    banned_until: Optional[datetime] = None
+    banned_until_us: Optional[int] = None  # Epoch microseconds
+    
+    # Normalised grant ("*" dropped); read and assigned via allowed_regions
+    _allowed_regions: frozenset = field(init=False, repr=False)
+    
+    def __post_init__(self, allowed_regions: Optional[Iterable[str]]):
+        regions = frozenset({"main"} if allowed_regions is None else allowed_regions)
+        self.all_regions = self.all_regions or "*" in regions
+        self._allowed_regions = regions - {"*"}
+    
+    def set_regions(self, regions: Iterable[str]) -> None:
+        """Replace allowed regions from any iterable; "*" grants every region."""
+        regions = frozenset(regions)
+        self.all_regions = "*" in regions
+        self._allowed_regions = regions - {"*"}
+    
+    @property
+    def banned_until(self) -> Optional[datetime]:
+        if self.banned_until_us is None:
+            return None
+        return _from_us(self.banned_until_us)
+    
+    @banned_until.setter
+    def banned_until(self, value: Optional[datetime]):
+        self.banned_until_us = None if value is None else _to_us(value)
+
+
+# Set after the dataclass is built, so the class attribute isn't taken as
+# the allowed_regions init default; assignment goes through set_regions()
+AgentPermissions.allowed_regions = property(
+    attrgetter("_allowed_regions"),
+    AgentPermissions.set_regions,
+    doc="Allowed regions as a frozenset (without \"*\"; see all_regions)."
+)
 
 
 class AuthManager:
@@ -54,7 +209,10 @@ class AuthManager:
         self.storage = storage or InMemoryStorage()
         self.tokens: Dict[str, AgentToken] = {}
         self.permissions: Dict[str, AgentPermissions] = {}
-        self.rate_counters: Dict[str, Dict[str, int]] = {}
+        self.rate_counters: Dict[str, RateWindow] = {}
+        # Guards counter read-modify-writes (handlers may run in threadpools)
+        self._rate_lock = threading.Lock()
+        self._next_rate_prune = 0  # Monotonic second of the next stale-window sweep
         
     # ========== TOKEN MANAGEMENT ==========
     
@@ -67,12 +225,13 @@ class AuthManager:
         """Generate a new authentication token for an agent."""
         token = secrets.token_urlsafe(32)
         token_hash = self._hash_token(token)
+        now_us = _now_us()
         
         agent_token = AgentToken(
             agent_id=agent_id,
             token_hash=token_hash,
-            created_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(hours=expires_hours),
+            created_at_us=now_us,
+            expires_at_us=now_us + expires_hours * 3_600_000_000,
             scopes=scopes or ["connect", "perceive", "communicate", "move", "act"]
         )
         
@@ -81,33 +240,28 @@ class AuthManager:
     
     def verify_token(self, agent_id: str, token: str) -> bool:
         """Verify an agent's token is valid."""
-        if agent_id not in self.tokens:
-            return False
-            
-        agent_token = self.tokens[agent_id]
-        if not agent_token.is_valid():
+        agent_token = self.tokens.get(agent_id)
+        if agent_token is None or not agent_token.is_valid():
             return False
-            
-        return agent_token.token_hash == self._hash_token(token)
+        
+        return hmac.compare_digest(agent_token.token_hash, self._hash_token(token))
     
     def revoke_token(self, agent_id: str) -> bool:
         """Revoke an agent's token."""
-        if agent_id in self.tokens:
-            del self.tokens[agent_id]
-            return True
-        return False
+        with self._rate_lock:
+            self.rate_counters.pop(agent_id, None)
+        return self.tokens.pop(agent_id, None) is not None
     
-    def _hash_token(self, token: str) -> str:
-        """Hash a token for secure storage."""
-        return hashlib.sha256(token.encode()).hexdigest()
+    _hash_token = staticmethod(_hash_token)
     
     # ========== PERMISSIONS ==========
     
     def get_permissions(self, agent_id: str) -> AgentPermissions:
         """Get permissions for an agent."""
-        if agent_id not in self.permissions:
-            self.permissions[agent_id] = AgentPermissions(agent_id=agent_id)
-        return self.permissions[agent_id]
+        perms = self.permissions.get(agent_id)
+        if perms is None:
+            perms = self.permissions[agent_id] = AgentPermissions(agent_id=agent_id)
+        return perms
     
     def set_permissions(
         self,
@@ -117,7 +271,9 @@ class AuthManager:
         """Update permissions for an agent."""
         current = self.get_permissions(agent_id)
         for key, value in permissions.items():
-            if hasattr(current, key):
+            if key == "allowed_regions":
+                current.set_regions(value)
+            elif hasattr(current, key):
                 setattr(current, key, value)
         self.permissions[agent_id] = current
         return current
@@ -125,51 +281,55 @@ class AuthManager:
     def can_access_region(self, agent_id: str, region: str) -> bool:
         """Check if agent can access a region."""
         perms = self.get_permissions(agent_id)
-        if perms.banned_until and datetime.utcnow() < perms.banned_until:
+        if perms.banned_until_us is not None and _now_us() < perms.banned_until_us:
             return False
-        return "*" in perms.allowed_regions or region in perms.allowed_regions
+        
+        # Computed each call: permissions can change through set_regions()
+        # or direct edits, and the check is a bool plus a frozenset lookup
+        return perms.all_regions or region in perms.allowed_regions
     
     def has_scope(self, agent_id: str, scope: str) -> bool:
         """Check if agent's token has a specific scope."""
-        if agent_id not in self.tokens:
-            return False
-        return scope in self.tokens[agent_id].scopes
+        agent_token = self.tokens.get(agent_id)
+        return agent_token is not None and scope in agent_token.scopes
     
     # ========== RATE LIMITING ==========
     
     def check_rate_limit(
         self,
         agent_id: str,
-        action_type: str  # messages, actions, moves
+        action_type: Union[ActionKind, str]  # messages, actions, moves
     ) -> bool:
         """Check if agent is within rate limits. Returns True if allowed."""
-        perms = self.get_permissions(agent_id)
-        
-        limit_map = {
-            "messages": perms.rate_limit_messages,
-            "actions": perms.rate_limit_actions,
-            "moves": perms.rate_limit_moves
-        }
+        kind = _kind_of(action_type) if type(action_type) is str else action_type
+        if kind < len(_RATE_LIMIT_OF):
+            limit = _RATE_LIMIT_OF[kind](self.get_permissions(agent_id))
+        else:
+            limit = DEFAULT_RATE_LIMIT
         
-        limit = limit_map.get(action_type, 30)
-        
-        if agent_id not in self.rate_counters:
-            self.rate_counters[agent_id] = {}
-        
-        counter = self.rate_counters[agent_id].get(action_type, 0)
-        return counter < limit
+        window = self.rate_counters.get(agent_id)
+        if window is None:
+            return limit > 0
+        return window.total(kind, int(time.monotonic())) < limit
     
-    def record_action(self, agent_id: str, action_type: str) -> None:
-        """Record an action for rate limiting."""
-        if agent_id not in self.rate_counters:
-            self.rate_counters[agent_id] = {}
-        
-        current = self.rate_counters[agent_id].get(action_type, 0)
-        self.rate_counters[agent_id][action_type] = current + 1
+    def record_action(self, agent_id: str, action_type: Union[ActionKind, str]) -> None:
+        """Record an action for rate limiting (counted for the next minute)."""
+        kind = _kind_of(action_type) if type(action_type) is str else action_type
+        now_s = int(time.monotonic())
+        with self._rate_lock:
+            if now_s >= self._next_rate_prune:
+                self._prune_rate_counters(now_s)
+            window = self.rate_counters.get(agent_id)
+            if window is None:
+                window = self.rate_counters[agent_id] = RateWindow()
+            window.add(kind, now_s)
     
-    def reset_rate_limits(self) -> None:
-        """Reset all rate limit counters. Call this every minute."""
-        self.rate_counters.clear()
+    def _prune_rate_counters(self, now_s: int) -> None:
+        """Drop windows with nothing left in them (at most once per RATE_WINDOW)."""
+        self._next_rate_prune = now_s + RATE_WINDOW
+        counters = self.rate_counters
+        for agent_id in [a for a, w in counters.items() if w.is_stale(now_s)]:
+            del counters[agent_id]
     
     # ========== BAN MANAGEMENT ==========
     
@@ -181,7 +341,7 @@ class AuthManager:
     ) -> None:
         """Temporarily ban an agent."""
         perms = self.get_permissions(agent_id)
-        perms.banned_until = datetime.utcnow() + timedelta(hours=duration_hours)
+        perms.banned_until_us = _now_us() + int(duration_hours * 3_600_000_000)
         self.permissions[agent_id] = perms
         
         # Log the ban
@@ -190,31 +350,37 @@ class AuthManager:
             "agent_id": agent_id,
             "duration_hours": duration_hours,
             "reason": reason,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_iso_now()
         })
     
     def unban_agent(self, agent_id: str) -> None:
         """Remove ban from an agent."""
         perms = self.get_permissions(agent_id)
-        perms.banned_until = None
+        perms.banned_until_us = None
         self.permissions[agent_id] = perms
     
     def is_banned(self, agent_id: str) -> bool:
         """Check if agent is currently banned."""
         perms = self.get_permissions(agent_id)
-        if perms.banned_until is None:
+        if perms.banned_until_us is None:
             return False
-        return datetime.utcnow() < perms.banned_until
+        return _now_us() < perms.banned_until_us
 
 
 class InMemoryStorage:
-    """Simple in-memory storage for development."""
+    """Simple in-memory storage for development.
     
-    def __init__(self):
-        self.events = []
+    Keeps the newest `capacity` events; older ones drop off.
+    """
+    
+    def __init__(self, capacity: int = EVENT_LOG_CAPACITY):
+        self.events: deque = deque(maxlen=capacity)
     
     def log_event(self, event: Dict[str, Any]) -> None:
         self.events.append(event)
     
     def get_events(self, limit: int = 100) -> List[Dict[str, Any]]:
-        return self.events[-limit:]
+        """Same slice as events[-limit:] (limit=0 returns every event)."""
+        events = self.events
+        start = len(events) - limit if limit > 0 else -limit
+        return list(islice(events, max(0, start), None))
@@ -5,22 +5,53 @@ Manages human spectator connections to their AI bots.
 """
 
 from typing import Optional, Dict, List, Any, Callable
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum
+from itertools import count, islice
+from enum import IntEnum
 import asyncio
 import json
 
+from timeutil import utc_iso_now
 
-class CameraMode(Enum):
-    """Camera modes for spectator."""
-    FOLLOW = "follow"           # Follow the bot
-    FIRST_PERSON = "first_person"  # See through bot's eyes
-    FREE = "free"               # Free camera control
-    OVERVIEW = "overview"       # Bird's eye view of region
+# Prefer orjson for spectator payloads, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
+if HAS_ORJSON:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    def _dumps(obj: Any) -> str:
+        # Same encoding as Starlette's send_json
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
 
-@dataclass
+
+class CameraMode(IntEnum):
+    """Camera modes for spectator.
+    
+    On the wire a mode is its lowercase name ("follow", "first_person",
+    ...); CameraMode("follow") still resolves the wire string.
+    """
+    FOLLOW = 1                  # Follow the bot
+    FIRST_PERSON = 2            # See through bot's eyes
+    FREE = 3                    # Free camera control
+    OVERVIEW = 4                # Bird's eye view of region
+    
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
+_MODE_NAMES = {mode: mode.name.lower() for mode in CameraMode}
+
+
+@dataclass(slots=True)
 class CameraState:
     """Current camera state."""
     mode: CameraMode = CameraMode.FOLLOW
@@ -34,14 +65,39 @@ class CameraState:
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "mode": self.mode.value,
+            "mode": _MODE_NAMES[self.mode],
             "position": {"x": self.x, "y": self.y, "z": self.z},
             "look_at": {"x": self.look_at_x, "y": self.look_at_y, "z": self.look_at_z},
             "zoom": self.zoom
         }
 
 
-@dataclass
+def _follow_camera(camera: CameraState, loc) -> None:
+    """Aim at the bot from behind and above."""
+    x, y, z = loc.x, loc.y, loc.z
+    camera.look_at_x = x
+    camera.look_at_y = y
+    camera.look_at_z = z
+    camera.x = x - 5
+    camera.y = y - 5
+    camera.z = z + 10
+
+
+def _first_person_camera(camera: CameraState, loc) -> None:
+    """Put the camera at the bot's eye level."""
+    camera.x = loc.x
+    camera.y = loc.y
+    camera.z = loc.z + 1.6
+
+
+# Modes whose camera tracks the bot each tick
+_CAMERA_TRACKERS = {
+    CameraMode.FOLLOW: _follow_camera,
+    CameraMode.FIRST_PERSON: _first_person_camera,
+}
+
+
+@dataclass(slots=True)
 class AIThought:
     """A thought/reasoning from the AI."""
     timestamp: str
@@ -56,7 +112,7 @@ class AIThought:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SpectatorSession:
     """
     A human spectator session watching their AI bot.
@@ -80,13 +136,26 @@ class SpectatorSession:
     show_nearby_agents: bool = True
     show_minimap: bool = True
     
-    # Buffered data
-    pending_events: List[Dict] = field(default_factory=list)
-    thought_history: List[AIThought] = field(default_factory=list)
-    chat_history: List[Dict] = field(default_factory=list)
+    # Buffered data (bounded: oldest entries drop off)
+    pending_events: deque = field(default_factory=lambda: deque(maxlen=100))
+    thought_history: deque = field(default_factory=lambda: deque(maxlen=50))
+    chat_history: deque = field(default_factory=lambda: deque(maxlen=100))
     
     # Prompt queue (human -> AI)
-    prompt_queue: List[str] = field(default_factory=list)
+    prompt_queue: deque = field(default_factory=deque)
+    
+    # Last agent_update sent: (view key, (json text, event))
+    last_update: Optional[tuple] = field(default=None, repr=False)
+    
+    def recent_thoughts(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Last n thoughts, oldest first."""
+        history = self.thought_history
+        return [t.to_dict() for t in islice(history, max(0, len(history) - n), None)]
+    
+    def recent_chat(self, n: int = 20) -> List[Dict]:
+        """Last n chat entries, oldest first."""
+        history = self.chat_history
+        return list(islice(history, max(0, len(history) - n), None))
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -121,7 +190,11 @@ class SpectatorManager:
         self.mcp = mcp_server
         
         self.sessions: Dict[str, SpectatorSession] = {}
-        self._next_session_id = 1
+        self._session_ids = count(1)
+        
+        # agent_id / human_id -> {session_id: session}
+        self._by_agent: Dict[str, Dict[str, SpectatorSession]] = {}
+        self._by_human: Dict[str, Dict[str, SpectatorSession]] = {}
         
         # Callbacks
         self._on_prompt: List[Callable] = []  # When human sends prompt
@@ -162,34 +235,28 @@ class SpectatorManager:
             agent_id: AI bot to watch
             websocket: WebSocket connection for real-time updates
         """
-        session_id = f"spec_{self._next_session_id:04d}"
-        self._next_session_id += 1
+        session_id = f"spec_{next(self._session_ids):04d}"
         
         # Get agent's current position for camera
         agent = self.world.get_agent(agent_id)
         camera = CameraState()
         
-        if agent and hasattr(agent, 'location'):
-            loc = agent.location
-            camera.look_at_x = loc.x
-            camera.look_at_y = loc.y
-            camera.look_at_z = loc.z
-            # Position camera behind and above
-            camera.x = loc.x - 5
-            camera.y = loc.y - 5
-            camera.z = loc.z + 10
+        if agent:
+            _follow_camera(camera, agent.location)
         
         session = SpectatorSession(
             session_id=session_id,
             human_id=human_id,
             agent_id=agent_id,
             connected=True,
-            connected_at=datetime.utcnow().isoformat(),
+            connected_at=utc_iso_now(),
             websocket=websocket,
             camera=camera
         )
         
         self.sessions[session_id] = session
+        self._by_agent.setdefault(agent_id, {})[session_id] = session
+        self._by_human.setdefault(human_id, {})[session_id] = session
         print(f"👁️ Spectator connected: {human_id} watching {agent_id}")
         
         # Send initial state
@@ -201,6 +268,8 @@ class SpectatorManager:
         """Disconnect a spectator session."""
         session = self.sessions.pop(session_id, None)
         if session:
+            self._unindex(self._by_agent, session.agent_id, session_id)
+            self._unindex(self._by_human, session.human_id, session_id)
             session.connected = False
             if session.websocket:
                 try:
@@ -211,17 +280,28 @@ class SpectatorManager:
             return True
         return False
     
+    @staticmethod
+    def _unindex(index: Dict[str, Dict[str, SpectatorSession]], key: str, session_id: str):
+        """Remove a session from an index bucket."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(session_id, None)
+            if not bucket:
+                del index[key]
+    
     def get_session(self, session_id: str) -> Optional[SpectatorSession]:
         """Get session by ID."""
         return self.sessions.get(session_id)
     
     def get_sessions_for_agent(self, agent_id: str) -> List[SpectatorSession]:
         """Get all spectators watching an agent."""
-        return [s for s in self.sessions.values() if s.agent_id == agent_id]
+        bucket = self._by_agent.get(agent_id)
+        return list(bucket.values()) if bucket else []
     
     def get_sessions_for_human(self, human_id: str) -> List[SpectatorSession]:
         """Get all sessions for a human."""
-        return [s for s in self.sessions.values() if s.human_id == human_id]
+        bucket = self._by_human.get(human_id)
+        return list(bucket.values()) if bucket else []
     
     # ========== CAMERA CONTROL ==========
     
@@ -236,6 +316,7 @@ class SpectatorManager:
             return False
         
         session.camera.mode = mode
+        session.last_update = None
         await self._send_camera_update(session)
         return True
     
@@ -298,14 +379,14 @@ class SpectatorManager:
             "type": "human_instruction",
             "from": session.human_id,
             "instruction": prompt,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_iso_now()
         }
         
         # Send to spectator as confirmation
         await self._send_event(session, {
             "type": "prompt_sent",
             "prompt": prompt,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_iso_now()
         })
         
         return {
@@ -324,7 +405,7 @@ class SpectatorManager:
         
         for session in self.get_sessions_for_agent(agent_id):
             while session.prompt_queue:
-                prompt = session.prompt_queue.pop(0)
+                prompt = session.prompt_queue.popleft()
                 prompts.append({
                     "from": session.human_id,
                     "instruction": prompt,
@@ -351,7 +432,7 @@ class SpectatorManager:
         Broadcasts to all spectators watching this agent.
         """
         thought_obj = AIThought(
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=utc_iso_now(),
             thought=thought,
             action=action
         )
@@ -359,9 +440,6 @@ class SpectatorManager:
         for session in self.get_sessions_for_agent(agent_id):
             if session.show_thoughts:
                 session.thought_history.append(thought_obj)
-                # Keep last 50 thoughts
-                if len(session.thought_history) > 50:
-                    session.thought_history.pop(0)
                 
                 await self._send_event(session, {
                     "type": "ai_thought",
@@ -385,10 +463,19 @@ class SpectatorManager:
             try:
                 await session.websocket.send_json(event)
             except:
-                # Buffer if send fails
-                session.pending_events.append(event)
-                if len(session.pending_events) > 100:
-                    session.pending_events.pop(0)
+                self._buffer_event(session, event)
+    
+    async def _send_encoded(self, session: SpectatorSession, text: str, event: Dict):
+        """Send an already-serialized event to a spectator."""
+        if session.websocket and session.connected:
+            try:
+                await session.websocket.send_text(text)
+            except:
+                self._buffer_event(session, event)
+    
+    def _buffer_event(self, session: SpectatorSession, event: Dict):
+        """Buffer an event that failed to send."""
+        session.pending_events.append(event)
     
     async def _send_camera_update(self, session: SpectatorSession):
         """Send camera state update."""
@@ -406,27 +493,28 @@ class SpectatorManager:
             "session": session.to_dict(),
             "agent": None,
             "nearby_agents": [],
-            "recent_chat": session.chat_history[-20:],
-            "recent_thoughts": [t.to_dict() for t in session.thought_history[-10:]]
+            "recent_chat": session.recent_chat(20),
+            "recent_thoughts": session.recent_thoughts(10)
         }
         
         if agent:
+            loc = agent.location
             state["agent"] = {
                 "agent_id": agent.agent_id,
                 "name": agent.name,
                 "location": {
-                    "x": agent.location.x,
-                    "y": agent.location.y,
-                    "z": agent.location.z,
-                    "region": agent.location.region
-                } if hasattr(agent, 'location') else None,
-                "status": agent.status if hasattr(agent, 'status') else "online"
+                    "x": loc.x,
+                    "y": loc.y,
+                    "z": loc.z,
+                    "region": loc.region
+                },
+                "status": agent.status
             }
             
             # Get nearby agents
             nearby = self.world.get_nearby_agents(session.agent_id, 20.0)
             state["nearby_agents"] = [
-                {"agent_id": a.id, "name": a.name} 
+                {"agent_id": a["agent_id"], "name": a["name"]}
                 for a in (nearby or [])
             ]
         
@@ -439,49 +527,64 @@ class SpectatorManager:
         while self._running:
             await asyncio.sleep(0.5)  # Update rate
             
-            for session in list(self.sessions.values()):
+            try:
+                await self._tick()
+            except Exception as e:
+                print(f"Session update error: {e}")
+    
+    async def _tick(self):
+        """Push one round of agent/camera updates to every live session."""
+        sends = []
+        for agent_id, sessions in self._by_agent.items():
+            agent = self.world.get_agent(agent_id)
+            if not agent:
+                continue
+            
+            loc = agent.location
+            pos = (loc.x, loc.y, loc.z)
+            # Spectators of one agent with the same camera get the same bytes
+            encoded: Dict[tuple, tuple] = {}
+            
+            for session in sessions.values():
                 if not session.connected:
                     continue
+                camera = session.camera
+                mode = camera.mode
+                last = session.last_update
                 
-                try:
-                    await self._update_session(session)
-                except Exception as e:
-                    print(f"Session update error: {e}")
-    
-    async def _update_session(self, session: SpectatorSession):
-        """Update a single spectator session."""
-        agent = self.world.get_agent(session.agent_id)
-        if not agent:
-            return
-        
-        # Update camera if in follow mode
-        if session.camera.mode == CameraMode.FOLLOW and hasattr(agent, 'location'):
-            loc = agent.location
-            session.camera.look_at_x = loc.x
-            session.camera.look_at_y = loc.y
-            session.camera.look_at_z = loc.z
-            # Camera behind and above
-            session.camera.x = loc.x - 5
-            session.camera.y = loc.y - 5
-            session.camera.z = loc.z + 10
-        
-        elif session.camera.mode == CameraMode.FIRST_PERSON and hasattr(agent, 'location'):
-            loc = agent.location
-            session.camera.x = loc.x
-            session.camera.y = loc.y
-            session.camera.z = loc.z + 1.6  # Eye level
+                # Update camera if in follow or first-person mode, unless it
+                # was already tracked to this position in this mode
+                track = _CAMERA_TRACKERS.get(mode)
+                if track is not None and (
+                    last is None or last[0][0] != pos or last[0][1] is not mode
+                ):
+                    track(camera, loc)
+                
+                key = (
+                    pos, mode, camera.x, camera.y, camera.z,
+                    camera.look_at_x, camera.look_at_y, camera.look_at_z,
+                    camera.zoom
+                )
+                payload = encoded.get(key)
+                if payload is None:
+                    if last is not None and last[0] == key:
+                        # Nothing moved since last tick: resend the same payload
+                        payload = last[1]
+                    else:
+                        event = {
+                            "type": "agent_update",
+                            "agent_id": agent_id,
+                            "position": {"x": loc.x, "y": loc.y, "z": loc.z},
+                            "camera": camera.to_dict()
+                        }
+                        payload = (_dumps(event), event)
+                    encoded[key] = payload
+                session.last_update = (key, payload)
+                
+                sends.append(self._send_encoded(session, *payload))
         
-        # Send position update
-        await self._send_event(session, {
-            "type": "agent_update",
-            "agent_id": session.agent_id,
-            "position": {
-                "x": agent.location.x,
-                "y": agent.location.y,
-                "z": agent.location.z
-            } if hasattr(agent, 'location') else None,
-            "camera": session.camera.to_dict()
-        })
+        # Overlap the websocket writes instead of awaiting them in turn
+        await asyncio.gather(*sends, return_exceptions=True)
     
     # ========== CHAT RELAY ==========
     
@@ -499,15 +602,12 @@ class SpectatorManager:
             "speaker_name": speaker_name,
             "message": message,
             "is_own": is_own,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_iso_now()
         }
         
         for session in self.get_sessions_for_agent(agent_id):
             if session.show_chat_log:
                 session.chat_history.append(chat_entry)
-                # Keep last 100 messages
-                if len(session.chat_history) > 100:
-                    session.chat_history.pop(0)
                 
                 await self._send_event(session, {
                     "type": "chat_message",
@@ -0,0 +1,25 @@
+"""
+ClawBots Time Utilities
+
+Timestamp helpers shared across modules.
+"""
+
+from datetime import datetime, timezone
+import time
+
+
+# [whole epoch second, its ISO string]
+_ts_cache: list = [0, ""]
+
+
+def utc_iso_now() -> str:
+    """Current UTC time as a second-resolution naive ISO string.
+    
+    Formatted at most once per second; events logged within the same
+    second share the string.
+    """
+    s = int(time.time())
+    if _ts_cache[0] != s:
+        dt = datetime.fromtimestamp(s, timezone.utc).replace(tzinfo=None)
+        _ts_cache[:] = [s, dt.isoformat()]
+    return _ts_cache[1]
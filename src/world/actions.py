@@ -4,11 +4,15 @@ ClawBots Action Executor
 Handles execution of agent actions in the world.
 """
 
-from typing import Optional, Dict, List, Any, Callable
+from typing import Optional, Dict, List, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
+from itertools import count
+from types import MappingProxyType
 import asyncio
+import inspect
+import time
 
 
 class ActionType(Enum):
@@ -37,8 +41,15 @@ class ActionType(Enum):
     DISCONNECT = "disconnect"
 
 
-class ActionResult(Enum):
-    """Result of action execution."""
+# Dense index per action type for list-based dispatch. Enum members hash
+# through a Python-level __hash__, so dict lookups keyed by them are slow.
+for _i, _action_type in enumerate(ActionType):
+    _action_type._idx = _i
+del _i, _action_type
+
+
+class ActionResult(StrEnum):
+    """Result of action execution (members are their wire strings)."""
     SUCCESS = "success"
     FAILED = "failed"
     DENIED = "denied"  # Permission denied
@@ -47,7 +58,15 @@ class ActionResult(Enum):
     NOT_FOUND = "not_found"
 
 
-@dataclass
+# Built-in emotes; others are passed through as custom emotes
+_VALID_EMOTES = frozenset({
+    "wave", "nod", "shake_head", "shrug", "laugh", "cry",
+    "think", "bow", "clap", "point", "sit", "stand",
+    "dance", "cheer", "frown", "smile"
+})
+
+
+@dataclass(slots=True)
 class ActionRequest:
     """A request to perform an action."""
     id: str
@@ -57,37 +76,54 @@ class ActionRequest:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResponse:
     """Response from action execution."""
-    request_id: str
+    request_id: int  # Sent as "act_<n>"
     result: ActionResult
     data: Dict[str, Any] = field(default_factory=dict)
     message: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "request_id": self.request_id,
-            "result": self.result.value,
+            "request_id": f"act_{self.request_id}",
+            "result": self.result,
             "data": self.data,
             "message": self.message
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionCooldown:
     """Cooldown tracking for action rate limiting."""
     action_type: ActionType
-    last_used: datetime
+    last_used: float  # time.monotonic() when the action was used
     cooldown_seconds: float
     
-    def can_use(self) -> bool:
-        elapsed = (datetime.utcnow() - self.last_used).total_seconds()
-        return elapsed >= self.cooldown_seconds
+    def can_use(self, now: Optional[float] = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        return now - self.last_used >= self.cooldown_seconds
     
-    def remaining(self) -> float:
-        elapsed = (datetime.utcnow() - self.last_used).total_seconds()
-        return max(0, self.cooldown_seconds - elapsed)
+    def remaining(self, now: Optional[float] = None) -> float:
+        if now is None:
+            now = time.monotonic()
+        return max(0, self.cooldown_seconds - (now - self.last_used))
+
+
+# Queued execution: workers take up to BATCH_SIZE actions at a time,
+# waiting at most BATCH_WINDOW seconds for a batch to fill
+BATCH_SIZE = 64
+BATCH_WINDOW = 0.005
+NUM_WORKERS = 4
+_RETIRE = None  # Queue sentinel: the worker that takes it exits
+
+
+class _Cooldowns(dict):
+    """Cooldown seconds per ActionType; unlisted types have none."""
+    
+    def __missing__(self, action_type: ActionType) -> float:
+        return 0.0
 
 
 class ActionExecutor:
@@ -105,13 +141,14 @@ class ActionExecutor:
     def __init__(self, world_engine, auth_manager):
         self.world = world_engine
         self.auth = auth_manager
-        self.action_counter: int = 0
+        self._action_ids = count(1)
         
-        # Cooldowns per agent
-        self.cooldowns: Dict[str, Dict[ActionType, ActionCooldown]] = {}
+        # Monotonic deadline until which (agent_id, action_type._idx) is
+        # on cooldown
+        self.cooldowns: Dict[Tuple[str, int], float] = {}
         
-        # Default cooldowns (seconds)
-        self.default_cooldowns = {
+        # Default cooldowns (seconds); change through set_cooldown()
+        self._default_cooldowns = _Cooldowns({
             ActionType.SAY: 0.5,
             ActionType.WHISPER: 0.5,
             ActionType.EMOTE: 1.0,
@@ -119,10 +156,10 @@ class ActionExecutor:
             ActionType.TELEPORT: 5.0,
             ActionType.USE_OBJECT: 1.0,
             ActionType.GIVE_ITEM: 2.0,
-        }
+        })
         
-        # Action handlers
-        self.handlers: Dict[ActionType, Callable] = {
+        # Action handlers; change through register_handler()
+        self._handlers: Dict[ActionType, Callable] = {
             ActionType.SAY: self._handle_say,
             ActionType.WHISPER: self._handle_whisper,
             ActionType.EMOTE: self._handle_emote,
@@ -133,6 +170,146 @@ class ActionExecutor:
             ActionType.USE_OBJECT: self._handle_use_object,
             ActionType.SET_STATUS: self._handle_set_status,
         }
+        
+        # Dispatch tables indexed by ActionType._idx, built from the above
+        self._handler_arr: List[Optional[Callable]] = [None] * len(ActionType)
+        # Handlers may be plain functions when the work never suspends
+        self._handler_is_async: List[bool] = [False] * len(ActionType)
+        for action_type, handler in self._handlers.items():
+            self._handler_arr[action_type._idx] = handler
+            self._handler_is_async[action_type._idx] = inspect.iscoroutinefunction(handler)
+        self._cooldown_arr: List[float] = [
+            self._default_cooldowns[action_type] for action_type in ActionType
+        ]
+        # Permission checks; None means the action is always allowed
+        self._perm_arr: List[Optional[Callable]] = [None] * len(ActionType)
+        self._perm_arr[ActionType.TELEPORT._idx] = self._check_teleport_permission
+        
+        # Action schema; rebuilt by set_cooldown() and shared by every caller
+        self._available_actions = self._build_available_actions()
+        
+        # Action queue, set while workers are running (see start())
+        self._pending: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._batch_size = BATCH_SIZE
+        self._num_workers = NUM_WORKERS
+        self._retiring = 0
+    
+    @property
+    def handlers(self) -> MappingProxyType:
+        """Action handlers by type (read-only; see register_handler())."""
+        return MappingProxyType(self._handlers)
+    
+    @property
+    def default_cooldowns(self) -> MappingProxyType:
+        """Cooldown seconds by type (read-only; see set_cooldown())."""
+        return MappingProxyType(self._default_cooldowns)
+    
+    def register_handler(self, action_type: ActionType, handler: Callable) -> None:
+        """Register or replace the handler for an action type."""
+        self._handlers[action_type] = handler
+        self._handler_arr[action_type._idx] = handler
+        self._handler_is_async[action_type._idx] = inspect.iscoroutinefunction(handler)
+    
+    def set_cooldown(self, action_type: ActionType, seconds: float) -> None:
+        """Set the default cooldown for an action type (0 disables it)."""
+        self._default_cooldowns[action_type] = seconds
+        self._cooldown_arr[action_type._idx] = seconds
+        self._available_actions = self._build_available_actions()
+    
+    # ========== WORKER POOL ==========
+    
+    async def start(self, num_workers: Optional[int] = None) -> None:
+        """Route execute() through a queue drained by batching workers."""
+        if self._pending is not None:
+            return
+        if num_workers is not None:
+            self._num_workers = num_workers
+        self._pending = asyncio.Queue()
+        self._workers = []
+        self._retiring = 0
+        self.set_num_workers(self._num_workers)
+    
+    async def stop(self) -> None:
+        """Stop the workers; actions still queued are cancelled."""
+        queue, self._pending = self._pending, None
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        
+        while queue is not None and not queue.empty():
+            item = queue.get_nowait()
+            if item is not _RETIRE:
+                item[3].cancel()
+    
+    def set_batch_size(self, batch_size: int) -> None:
+        """Change how many actions a worker takes at once (applies live)."""
+        self._batch_size = max(1, batch_size)
+    
+    def set_num_workers(self, num_workers: int) -> None:
+        """Grow or shrink the worker pool (applies live).
+        
+        Surplus workers retire after the actions queued before the resize.
+        """
+        self._num_workers = num_workers = max(1, num_workers)
+        queue = self._pending
+        if queue is None:
+            return
+        
+        # Workers already handed a retire sentinel don't count
+        running = len(self._workers) - self._retiring
+        for _ in range(num_workers, running):
+            queue.put_nowait(_RETIRE)
+            self._retiring += 1
+        for _ in range(running, num_workers):
+            self._workers.append(asyncio.create_task(self._worker()))
+    
+    async def _worker(self) -> None:
+        """Run queued actions a batch at a time, concurrently within a batch."""
+        queue = self._pending
+        retire = False
+        while not retire:
+            item = await queue.get()
+            if item is _RETIRE:
+                retire = True
+                break
+            batch = [item]
+            if 0 < queue.qsize() < self._batch_size - 1:
+                # Others are queued: give concurrent callers a moment to
+                # join this batch. A lone action runs without waiting.
+                await asyncio.sleep(BATCH_WINDOW)
+            while len(batch) < self._batch_size and not queue.empty():
+                item = queue.get_nowait()
+                if item is _RETIRE:
+                    retire = True
+                    break
+                batch.append(item)
+            
+            run = self._run_queued
+            await asyncio.gather(*(run(*item) for item in batch))
+        
+        self._retiring -= 1
+        self._workers.remove(asyncio.current_task())
+    
+    async def _run_queued(
+        self,
+        agent_id: str,
+        action_type: ActionType,
+        params: Dict[str, Any],
+        future: asyncio.Future
+    ) -> None:
+        try:
+            response = await self._execute(agent_id, action_type, params)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(response)
     
     # ========== MAIN EXECUTION ==========
     
@@ -142,9 +319,31 @@ class ActionExecutor:
         action_type: ActionType,
         params: Dict[str, Any]
     ) -> ActionResponse:
-        """Execute an action for an agent."""
-        self.action_counter += 1
-        request_id = f"act_{self.action_counter}"
+        """Execute an action for an agent.
+        
+        Runs inline unless start() has set up the worker pool, in which
+        case the action is queued and this waits for its response.
+        """
+        queue = self._pending
+        if queue is None:
+            return await self._execute(agent_id, action_type, params)
+        
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((agent_id, action_type, params, future))
+        return await future
+    
+    async def _execute(
+        self,
+        agent_id: str,
+        action_type: ActionType,
+        params: Dict[str, Any]
+    ) -> ActionResponse:
+        request_id = next(self._action_ids)
+        # One clock read per action, shared by every cooldown check
+        now = time.monotonic()
+        idx = action_type._idx
+        cooldown_key = (agent_id, idx)
+        cooldowns = self.cooldowns
         
         # Check if agent exists
         agent = self.world.get_agent(agent_id)
@@ -156,16 +355,18 @@ class ActionExecutor:
             )
         
         # Check cooldown
-        if not self._check_cooldown(agent_id, action_type):
-            cd = self.cooldowns[agent_id][action_type]
+        deadline = cooldowns.get(cooldown_key)
+        if deadline is not None and now < deadline:
+            remaining = deadline - now
             return ActionResponse(
                 request_id=request_id,
                 result=ActionResult.RATE_LIMITED,
-                message=f"Action on cooldown for {cd.remaining():.1f}s"
+                message=f"Action on cooldown for {remaining:.1f}s"
             )
         
         # Check permissions (basic)
-        if not self._check_permission(agent_id, action_type, params):
+        check = self._perm_arr[idx]
+        if check is not None and not check(agent_id, params):
             return ActionResponse(
                 request_id=request_id,
                 result=ActionResult.DENIED,
@@ -173,8 +374,8 @@ class ActionExecutor:
             )
         
         # Get handler
-        handler = self.handlers.get(action_type)
-        if not handler:
+        handler = self._handler_arr[idx]
+        if handler is None:
             return ActionResponse(
                 request_id=request_id,
                 result=ActionResult.INVALID,
@@ -183,8 +384,15 @@ class ActionExecutor:
         
         # Execute
         try:
-            result = await handler(agent_id, params)
-            self._update_cooldown(agent_id, action_type)
+            if self._handler_is_async[idx]:
+                result = await handler(agent_id, params)
+            else:
+                result = handler(agent_id, params)
+            
+            # Start the cooldown (counted from when the action started)
+            cooldown_time = self._cooldown_arr[idx]
+            if cooldown_time:
+                cooldowns[cooldown_key] = now + cooldown_time
             return ActionResponse(
                 request_id=request_id,
                 result=ActionResult.SUCCESS,
@@ -203,48 +411,17 @@ class ActionExecutor:
                 message=str(e)
             )
     
-    # ========== COOLDOWNS ==========
-    
-    def _check_cooldown(self, agent_id: str, action_type: ActionType) -> bool:
-        """Check if action is off cooldown."""
-        if agent_id not in self.cooldowns:
-            return True
-        
-        if action_type not in self.cooldowns[agent_id]:
-            return True
-        
-        return self.cooldowns[agent_id][action_type].can_use()
-    
-    def _update_cooldown(self, agent_id: str, action_type: ActionType) -> None:
-        """Update cooldown after action use."""
-        if agent_id not in self.cooldowns:
-            self.cooldowns[agent_id] = {}
-        
-        cooldown_time = self.default_cooldowns.get(action_type, 0)
-        
-        self.cooldowns[agent_id][action_type] = ActionCooldown(
-            action_type=action_type,
-            last_used=datetime.utcnow(),
-            cooldown_seconds=cooldown_time
-        )
-    
     # ========== PERMISSIONS ==========
     
-    def _check_permission(
+    def _check_teleport_permission(
         self,
         agent_id: str,
-        action_type: ActionType,
         params: Dict[str, Any]
     ) -> bool:
-        """Check if agent has permission for action."""
-        # Basic checks - can extend with auth manager
-        
-        # Teleport permission
-        if action_type == ActionType.TELEPORT:
-            region = params.get("region")
-            if region and self.auth:
-                return self.auth.can_access_region(agent_id, region)
-        
+        """Check if agent may teleport to the requested region."""
+        region = params.get("region")
+        if region and self.auth:
+            return self.auth.can_access_region(agent_id, region)
         return True
     
     # ========== ACTION HANDLERS ==========
@@ -307,13 +484,7 @@ class ActionExecutor:
             raise ValueError("action is required")
         
         # Validate emote
-        valid_emotes = [
-            "wave", "nod", "shake_head", "shrug", "laugh", "cry",
-            "think", "bow", "clap", "point", "sit", "stand",
-            "dance", "cheer", "frown", "smile"
-        ]
-        
-        if action not in valid_emotes:
+        if action not in _VALID_EMOTES:
             # Allow custom emotes but warn
             pass
         
@@ -369,7 +540,7 @@ class ActionExecutor:
             "teleported": success
         }
     
-    async def _handle_follow(
+    def _handle_follow(
         self,
         agent_id: str,
         params: Dict[str, Any]
@@ -381,7 +552,7 @@ class ActionExecutor:
         
         distance = params.get("distance", 2.0)
         
-        success = await self.world.set_follow(agent_id, target_id, distance)
+        success = self.world.set_follow_nowait(agent_id, target_id, distance)
         
         if not success:
             raise ValueError("Target agent not found")
@@ -391,13 +562,13 @@ class ActionExecutor:
             "distance": distance
         }
     
-    async def _handle_stop(
+    def _handle_stop(
         self,
         agent_id: str,
         params: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Handle stop action."""
-        success = await self.world.stop_agent(agent_id)
+        success = self.world.stop_agent_nowait(agent_id)
         
         return {
             "stopped": success
@@ -445,7 +616,13 @@ class ActionExecutor:
     # ========== UTILITIES ==========
     
     def get_available_actions(self) -> List[Dict[str, Any]]:
-        """Get list of available actions with their parameters."""
+        """Get list of available actions with their parameters.
+        
+        The list is shared; callers must not modify it.
+        """
+        return self._available_actions
+    
+    def _build_available_actions(self) -> List[Dict[str, Any]]:
         return [
             {
                 "action": "say",
@@ -453,7 +630,7 @@ class ActionExecutor:
                     "message": {"type": "string", "required": True},
                     "volume": {"type": "string", "enum": ["whisper", "normal", "shout"]}
                 },
-                "cooldown": self.default_cooldowns.get(ActionType.SAY, 0)
+                "cooldown": self._default_cooldowns.get(ActionType.SAY, 0)
             },
             {
                 "action": "whisper",
@@ -461,14 +638,14 @@ class ActionExecutor:
                     "target_id": {"type": "string", "required": True},
                     "message": {"type": "string", "required": True}
                 },
-                "cooldown": self.default_cooldowns.get(ActionType.WHISPER, 0)
+                "cooldown": self._default_cooldowns.get(ActionType.WHISPER, 0)
             },
             {
                 "action": "emote",
                 "params": {
                     "action": {"type": "string", "required": True}
                 },
-                "cooldown": self.default_cooldowns.get(ActionType.EMOTE, 0)
+                "cooldown": self._default_cooldowns.get(ActionType.EMOTE, 0)
             },
             {
                 "action": "move_to",
@@ -477,7 +654,7 @@ class ActionExecutor:
                     "y": {"type": "number", "required": True},
                     "z": {"type": "number"}
                 },
-                "cooldown": self.default_cooldowns.get(ActionType.MOVE_TO, 0)
+                "cooldown": self._default_cooldowns.get(ActionType.MOVE_TO, 0)
             },
             {
                 "action": "teleport",
@@ -487,7 +664,7 @@ class ActionExecutor:
                     "y": {"type": "number", "default": 128},
                     "z": {"type": "number", "default": 25}
                 },
-                "cooldown": self.default_cooldowns.get(ActionType.TELEPORT, 0)
+                "cooldown": self._default_cooldowns.get(ActionType.TELEPORT, 0)
             },
             {
                 "action": "follow",
@@ -508,7 +685,7 @@ class ActionExecutor:
                     "object_id": {"type": "string", "required": True},
                     "action": {"type": "string", "default": "use"}
                 },
-                "cooldown": self.default_cooldowns.get(ActionType.USE_OBJECT, 0)
+                "cooldown": self._default_cooldowns.get(ActionType.USE_OBJECT, 0)
             },
             {
                 "action": "set_status",
@@ -522,5 +699,5 @@ class ActionExecutor:
     
     def clear_cooldowns(self, agent_id: str) -> None:
         """Clear all cooldowns for an agent."""
-        if agent_id in self.cooldowns:
-            del self.cooldowns[agent_id]
+        for key in [key for key in self.cooldowns if key[0] == agent_id]:
+            del self.cooldowns[key]
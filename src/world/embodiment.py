@@ -5,13 +5,13 @@ Handles avatar appearance, animations, and attachments.
 """
 
 from typing import Optional, Dict, List, Any
-from dataclasses import dataclass, field
-from enum import Enum
-from datetime import datetime
+from dataclasses import dataclass, field, fields
+from enum import StrEnum
+import time
 
 
-class AvatarModel(Enum):
-    """Available avatar models."""
+class AvatarModel(StrEnum):
+    """Available avatar models (members are their wire strings)."""
     HUMANOID_V1 = "humanoid_v1"
     HUMANOID_V2 = "humanoid_v2"
     ROBOT = "robot"
@@ -20,8 +20,8 @@ class AvatarModel(Enum):
     CUSTOM = "custom"
 
 
-class AnimationState(Enum):
-    """Avatar animation states."""
+class AnimationState(StrEnum):
+    """Avatar animation states (members are their wire strings)."""
     IDLE = "idle"
     WALKING = "walking"
     RUNNING = "running"
@@ -34,7 +34,31 @@ class AnimationState(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+# Valid appearance options
+_VALID_HAIR_STYLES = frozenset({
+    "default", "short", "long", "bald", "ponytail",
+    "braids", "mohawk", "curly", "spiky"
+})
+
+_VALID_CLOTHING = frozenset({
+    "casual", "formal", "sporty", "robes", "armor",
+    "merchant", "traveler", "fantasy", "sci-fi"
+})
+
+_VALID_BODY_TYPES = frozenset({"slim", "average", "muscular", "heavy"})
+
+_VALID_EXPRESSIONS = frozenset({
+    "neutral", "happy", "sad", "angry", "surprised",
+    "confused", "thoughtful", "excited"
+})
+
+_VALID_ATTACHMENTS = frozenset({
+    "hat", "glasses", "backpack", "sword", "shield",
+    "book", "coin_pouch", "compass", "lantern", "cape"
+})
+
+
+@dataclass(slots=True)
 class AvatarAppearance:
     """Complete avatar appearance definition."""
     model: AvatarModel = AvatarModel.HUMANOID_V2
@@ -54,9 +78,23 @@ class AvatarAppearance:
     # Accessories
     accessories: List[str] = field(default_factory=list)
     
+    # Serialized form, cleared whenever a field is assigned
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+    
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "model": self.model.value,
+        """Serialized appearance (shared; reassign accessories to change it)."""
+        data = self._dict_cache
+        if data is not None:
+            return data
+        data = self._dict_cache = {
+            "model": self.model,
             "height": self.height,
             "body_type": self.body_type,
             "skin_tone": self.skin_tone,
@@ -67,9 +105,14 @@ class AvatarAppearance:
             "clothing_color": self.clothing_color,
             "accessories": self.accessories
         }
+        return data
+
 
+# Appearance attributes update_appearance() may change
+_APPEARANCE_FIELDS = frozenset(f.name for f in fields(AvatarAppearance) if f.init)
 
-@dataclass
+
+@dataclass(slots=True)
 class AvatarState:
     """Current state of an avatar."""
     agent_id: str
@@ -84,11 +127,29 @@ class AvatarState:
     # Expression
     expression: str = "neutral"  # happy, sad, angry, surprised, neutral
     
-    # Attachments currently worn
-    active_attachments: List[str] = field(default_factory=list)
+    # Attachments currently worn, in the order put on (dict as ordered set)
+    active_attachments: Dict[str, None] = field(default_factory=dict)
+    
+    # Timestamps (epoch seconds)
+    last_animation_change: float = field(default_factory=time.time)
+    
+    # Set by AvatarManager, which indexes avatars by region
+    _region: Optional[str] = field(default=None, init=False)
+    
+    # get_avatar_data() result, cleared whenever a field is assigned
+    _cached_data: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_cached_data":
+            object.__setattr__(self, "_cached_data", None)
     
-    # Timestamps
-    last_animation_change: datetime = field(default_factory=datetime.utcnow)
+    @property
+    def region(self) -> Optional[str]:
+        """Region the avatar is in (read-only; see AvatarManager.set_region())."""
+        return self._region
 
 
 class AvatarManager:
@@ -100,40 +161,32 @@ class AvatarManager:
     - Handle animation state
     - Manage attachments
     - Validate appearance options
+    
+    Avatar data is cached on each AvatarState and dropped when a field is
+    assigned; change attachments through attach()/detach() rather than
+    editing active_attachments in place.
     """
     
+    # Available options (shared, read-only)
+    valid_hair_styles = _VALID_HAIR_STYLES
+    valid_clothing = _VALID_CLOTHING
+    valid_body_types = _VALID_BODY_TYPES
+    valid_expressions = _VALID_EXPRESSIONS
+    valid_attachments = _VALID_ATTACHMENTS
+    
     def __init__(self):
         self.avatars: Dict[str, AvatarState] = {}
-        
-        # Available options
-        self.valid_hair_styles = [
-            "default", "short", "long", "bald", "ponytail",
-            "braids", "mohawk", "curly", "spiky"
-        ]
-        
-        self.valid_clothing = [
-            "casual", "formal", "sporty", "robes", "armor",
-            "merchant", "traveler", "fantasy", "sci-fi"
-        ]
-        
-        self.valid_body_types = ["slim", "average", "muscular", "heavy"]
-        
-        self.valid_expressions = [
-            "neutral", "happy", "sad", "angry", "surprised",
-            "confused", "thoughtful", "excited"
-        ]
-        
-        self.valid_attachments = [
-            "hat", "glasses", "backpack", "sword", "shield",
-            "book", "coin_pouch", "compass", "lantern", "cape"
-        ]
+        # region -> agent_ids (dict as ordered set, so results keep insertion
+        # order); the None bucket holds avatars with no region yet
+        self._region_index: Dict[Optional[str], Dict[str, None]] = {}
     
     # ========== AVATAR MANAGEMENT ==========
     
     def create_avatar(
         self,
         agent_id: str,
-        appearance: Optional[AvatarAppearance] = None
+        appearance: Optional[AvatarAppearance] = None,
+        region: Optional[str] = None
     ) -> AvatarState:
         """Create a new avatar for an agent."""
         if appearance is None:
@@ -144,7 +197,11 @@ class AvatarManager:
             appearance=appearance
         )
         
+        old = self.avatars.get(agent_id)
+        if old is not None:
+            self._unindex_region(old)
         self.avatars[agent_id] = state
+        self._index_region(state, region)
         return state
     
     def get_avatar(self, agent_id: str) -> Optional[AvatarState]:
@@ -153,10 +210,32 @@ class AvatarManager:
     
     def remove_avatar(self, agent_id: str) -> bool:
         """Remove an avatar."""
-        if agent_id in self.avatars:
-            del self.avatars[agent_id]
-            return True
-        return False
+        avatar = self.avatars.pop(agent_id, None)
+        if avatar is None:
+            return False
+        self._unindex_region(avatar)
+        return True
+    
+    def set_region(self, agent_id: str, region: Optional[str]) -> bool:
+        """Record which region an avatar is in."""
+        avatar = self.avatars.get(agent_id)
+        if not avatar:
+            return False
+        
+        self._unindex_region(avatar)
+        self._index_region(avatar, region)
+        return True
+    
+    def _index_region(self, avatar: AvatarState, region: Optional[str]) -> None:
+        avatar._region = region
+        self._region_index.setdefault(region, {})[avatar.agent_id] = None
+    
+    def _unindex_region(self, avatar: AvatarState) -> None:
+        bucket = self._region_index.get(avatar._region)
+        if bucket is not None:
+            bucket.pop(avatar.agent_id, None)
+            if not bucket:
+                del self._region_index[avatar._region]
     
     # ========== APPEARANCE ==========
     
@@ -170,9 +249,12 @@ class AvatarManager:
         if not avatar:
             return None
         
+        appearance = avatar.appearance
         for key, value in changes.items():
-            if hasattr(avatar.appearance, key):
-                setattr(avatar.appearance, key, value)
+            if key in _APPEARANCE_FIELDS:
+                # Bypass the per-assignment cache reset; cleared once below
+                object.__setattr__(appearance, key, value)
+        appearance._dict_cache = None
         
         return avatar
     
@@ -187,7 +269,7 @@ class AvatarManager:
         if not avatar:
             return False
         
-        if clothing not in self.valid_clothing:
+        if clothing not in _VALID_CLOTHING:
             return False
         
         avatar.appearance.clothing = clothing
@@ -211,7 +293,7 @@ class AvatarManager:
         
         avatar.animation = animation
         avatar.custom_animation = custom_name if animation == AnimationState.CUSTOM else None
-        avatar.last_animation_change = datetime.utcnow()
+        avatar.last_animation_change = time.time()
         
         return True
     
@@ -258,7 +340,7 @@ class AvatarManager:
         if not avatar:
             return False
         
-        if expression not in self.valid_expressions:
+        if expression not in _VALID_EXPRESSIONS:
             return False
         
         avatar.expression = expression
@@ -272,11 +354,12 @@ class AvatarManager:
         if not avatar:
             return False
         
-        if item not in self.valid_attachments:
+        if item not in _VALID_ATTACHMENTS:
             return False
         
         if item not in avatar.active_attachments:
-            avatar.active_attachments.append(item)
+            avatar.active_attachments[item] = None
+            avatar._cached_data = None
         
         return True
     
@@ -286,39 +369,55 @@ class AvatarManager:
         if not avatar:
             return False
         
-        if item in avatar.active_attachments:
-            avatar.active_attachments.remove(item)
-            return True
+        try:
+            del avatar.active_attachments[item]
+        except KeyError:
+            return False
         
-        return False
+        avatar._cached_data = None
+        return True
     
     def get_attachments(self, agent_id: str) -> List[str]:
         """Get list of attached items."""
         avatar = self.avatars.get(agent_id)
-        return avatar.active_attachments if avatar else []
+        return list(avatar.active_attachments) if avatar else []
     
     # ========== SERIALIZATION ==========
     
     def get_avatar_data(self, agent_id: str) -> Optional[Dict[str, Any]]:
-        """Get complete avatar data for an agent."""
+        """Get complete avatar data for an agent (shared; do not modify)."""
         avatar = self.avatars.get(agent_id)
         if not avatar:
             return None
         
-        return {
+        # A new appearance dict means the appearance changed since caching
+        appearance = avatar.appearance.to_dict()
+        data = avatar._cached_data
+        if data is not None and data["appearance"] is appearance:
+            return data
+        
+        data = avatar._cached_data = {
             "agent_id": agent_id,
-            "appearance": avatar.appearance.to_dict(),
-            "animation": avatar.animation.value,
+            "appearance": appearance,
+            "animation": avatar.animation,
             "custom_animation": avatar.custom_animation,
             "is_sitting": avatar.is_sitting,
             "is_flying": avatar.is_flying,
             "expression": avatar.expression,
-            "attachments": avatar.active_attachments
+            "attachments": list(avatar.active_attachments)
         }
+        return data
     
     def get_all_visible(self, region: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get data for all avatars (optionally filtered by region)."""
-        return [
-            self.get_avatar_data(agent_id)
-            for agent_id in self.avatars.keys()
-        ]
+        """Get data for all avatars (optionally filtered by region).
+        
+        Avatars with no recorded region are visible from every region.
+        """
+        get_data = self.get_avatar_data
+        if region is None:
+            return [get_data(agent_id) for agent_id in self.avatars]
+        
+        index = self._region_index
+        visible = [get_data(agent_id) for agent_id in index.get(region, ())]
+        visible.extend(get_data(agent_id) for agent_id in index.get(None, ()))
+        return visible
@@ -124,11 +124,10 @@ class WorldEngine:
         # Update following agents
         await self._update_following()
         
-        # Broadcast tick event
+        # Broadcast tick event (_emit_event stamps the timestamp)
         await self._emit_event({
             "type": "world_tick",
-            "tick": self.current_tick,
-            "timestamp": datetime.utcnow().isoformat()
+            "tick": self.current_tick
         })
     
     def stop(self):
@@ -404,6 +403,15 @@ class WorldEngine:
         distance: float
     ) -> bool:
         """Set an agent to follow another."""
+        return self.set_follow_nowait(agent_id, target_id, distance)
+    
+    def set_follow_nowait(
+        self,
+        agent_id: str,
+        target_id: str,
+        distance: float
+    ) -> bool:
+        """set_follow() for synchronous callers; it emits no events."""
         if agent_id not in self.agents or target_id not in self.agents:
             return False
         
@@ -412,6 +420,10 @@ class WorldEngine:
     
     async def stop_agent(self, agent_id: str) -> bool:
         """Stop agent movement/following."""
+        return self.stop_agent_nowait(agent_id)
+    
+    def stop_agent_nowait(self, agent_id: str) -> bool:
+        """stop_agent() for synchronous callers; it emits no events."""
         if agent_id not in self.agents:
             return False
         
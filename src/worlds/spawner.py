@@ -20,6 +20,13 @@ class WorldTemplate(Enum):
     WILDERNESS = "wild"    # Exploration, unknown
     CUSTOM = "custom"      # User-designed
 
+# RemoteAdmin connection pool (region admin calls are bursty but few)
+ADMIN_POOL_LIMITS = httpx.Limits(
+    max_connections=16,
+    max_keepalive_connections=16,
+    keepalive_expiry=60.0
+)
+
 @dataclass
 class WorldConfig:
     template: WorldTemplate
@@ -58,6 +65,20 @@ class WorldSpawner:
         self.oar_path = Path(oar_path)
         self.worlds: dict[str, World] = {}
         self._next_port = base_region_port
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Keep-alive HTTP client for RemoteAdmin (lazy init)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=ADMIN_POOL_LIMITS, timeout=30.0)
+        return self._client
+    
+    async def close(self):
+        """Close pooled RemoteAdmin connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def _remote_admin_call(self, method: str, params: dict) -> dict:
         """Call OpenSim RemoteAdmin XML-RPC"""
@@ -77,14 +98,12 @@ class WorldSpawner:
   </params>
 </methodCall>"""
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"http://{self.opensim_host}:{self.remote_admin_port}",
-                content=xml_body,
-                headers={"Content-Type": "text/xml"},
-                timeout=30.0
-            )
-            return {"status": resp.status_code, "body": resp.text}
+        resp = await self.client.post(
+            f"http://{self.opensim_host}:{self.remote_admin_port}",
+            content=xml_body,
+            headers={"Content-Type": "text/xml"}
+        )
+        return {"status": resp.status_code, "body": resp.text}
     
     async def create_world(self, config: WorldConfig) -> World:
         """Spawn a new world/region"""
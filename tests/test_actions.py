@@ -0,0 +1,95 @@
+"""Test ClawBots ActionExecutor"""
+import sys
+sys.path.insert(0, 'src')
+
+import asyncio
+
+import pytest
+
+import world.actions as actions_mod
+from world.actions import ActionExecutor, ActionType, ActionResult
+from world.engine import WorldEngine
+
+
+class _AllowAll:
+    def can_access_region(self, agent_id, region):
+        return True
+
+
+async def _executor():
+    world = WorldEngine()
+    await world.spawn_agent("a1", {"name": "Ann"})
+    return ActionExecutor(world, _AllowAll())
+
+
+def test_register_handler_updates_dispatch():
+    async def run():
+        executor = await _executor()
+        before = await executor.execute("a1", ActionType.GIVE_ITEM, {})
+
+        async def give(agent_id, params):
+            return {"given": params["item"]}
+        executor.register_handler(ActionType.GIVE_ITEM, give)
+        after = await executor.execute("a1", ActionType.GIVE_ITEM, {"item": "apple"})
+
+        executor.register_handler(ActionType.STOP, lambda agent_id, params: {"sync": True})
+        stopped = await executor.execute("a1", ActionType.STOP, {})
+        return before, after, stopped
+
+    before, after, stopped = asyncio.run(run())
+    assert before.result == ActionResult.INVALID
+    assert after.result == ActionResult.SUCCESS
+    assert after.data == {"given": "apple"}
+    assert stopped.data == {"sync": True}
+
+
+def test_set_cooldown_updates_dispatch_and_schema():
+    async def run():
+        executor = await _executor()
+        executor.set_cooldown(ActionType.EMOTE, 0)
+        first = await executor.execute("a1", ActionType.EMOTE, {"action": "wave"})
+        second = await executor.execute("a1", ActionType.EMOTE, {"action": "wave"})
+
+        executor.set_cooldown(ActionType.STOP, 60.0)
+        await executor.execute("a1", ActionType.STOP, {})
+        limited = await executor.execute("a1", ActionType.STOP, {})
+        return executor, first, second, limited
+
+    executor, first, second, limited = asyncio.run(run())
+    assert first.result == second.result == ActionResult.SUCCESS
+    assert limited.result == ActionResult.RATE_LIMITED
+    assert executor.default_cooldowns[ActionType.EMOTE] == 0
+
+    schema = {a["action"]: a["cooldown"] for a in executor.get_available_actions()}
+    assert schema["emote"] == 0
+
+
+def test_public_tables_are_read_only():
+    executor = asyncio.run(_executor())
+    with pytest.raises(TypeError):
+        executor.handlers[ActionType.GIVE_ITEM] = lambda agent_id, params: None
+    with pytest.raises(TypeError):
+        executor.default_cooldowns[ActionType.SAY] = 0
+    assert executor.default_cooldowns[ActionType.FOLLOW] == 0.0
+
+
+def test_pooled_single_action_skips_batch_window(monkeypatch):
+    monkeypatch.setattr(actions_mod, "BATCH_WINDOW", 5.0)
+
+    async def run():
+        executor = await _executor()
+        await executor.start(num_workers=1)
+        try:
+            async with asyncio.timeout(1.0):
+                return await executor.execute("a1", ActionType.STOP, {})
+        finally:
+            await executor.stop()
+
+    assert asyncio.run(run()).result == ActionResult.SUCCESS
+
+
+if __name__ == "__main__":
+    test_register_handler_updates_dispatch()
+    test_set_cooldown_updates_dispatch_and_schema()
+    test_public_tables_are_read_only()
+    print("✅ All tests passed!")
@@ -0,0 +1,149 @@
+"""Test ClawBots AuthManager"""
+import sys
+sys.path.insert(0, 'src')
+
+import registry.auth as auth_mod
+from registry.auth import ActionKind, AgentToken, AuthManager, InMemoryStorage
+
+
+def test_region_access_follows_set_regions():
+    auth = AuthManager()
+    auth.set_permissions("bot", {"allowed_regions": ["main", "forest"]})
+    assert auth.can_access_region("bot", "forest")
+
+    # Revoke through the permissions object itself
+    auth.get_permissions("bot").set_regions(["main"])
+    assert not auth.can_access_region("bot", "forest")
+    assert auth.can_access_region("bot", "main")
+
+
+def test_region_access_follows_direct_edits():
+    auth = AuthManager()
+    assert not auth.can_access_region("bot", "desert")
+
+    perms = auth.get_permissions("bot")
+    perms.all_regions = True
+    assert auth.can_access_region("bot", "desert")
+
+    perms.all_regions = False
+    assert not auth.can_access_region("bot", "desert")
+
+
+def test_region_access_wildcard_and_ban():
+    auth = AuthManager()
+    auth.set_permissions("bot", {"allowed_regions": ["*"]})
+    assert auth.can_access_region("bot", "anywhere")
+
+    auth.ban_agent("bot", duration_hours=1)
+    assert not auth.can_access_region("bot", "anywhere")
+    auth.unban_agent("bot")
+    assert auth.can_access_region("bot", "anywhere")
+
+
+def test_region_wildcard_normalised_to_flag():
+    auth = AuthManager()
+    perms = auth.set_permissions("bot", {"allowed_regions": ["*", "main"]})
+    assert perms.all_regions
+    assert perms.allowed_regions == frozenset({"main"})
+
+    perms.set_regions(["forest"])
+    assert not perms.all_regions
+    assert not auth.can_access_region("bot", "main")
+
+
+def test_region_wildcard_normalised_on_assignment():
+    auth = AuthManager()
+    perms = auth.get_permissions("bot")
+    perms.allowed_regions = frozenset({"*"})
+    assert perms.all_regions
+    assert auth.can_access_region("bot", "desert")
+
+    perms.allowed_regions = ["forest"]
+    assert perms.allowed_regions == frozenset({"forest"})
+    assert not auth.can_access_region("bot", "desert")
+    assert auth.can_access_region("bot", "forest")
+
+
+def test_scopes_follow_token_changes():
+    auth = AuthManager()
+    auth.generate_token("bot", scopes=["connect"])
+    assert auth.has_scope("bot", "connect")
+    assert not auth.has_scope("bot", "move")
+
+    auth.generate_token("bot", scopes=["move"])
+    assert auth.has_scope("bot", "move")
+    assert not auth.has_scope("bot", "connect")
+
+    auth.revoke_token("bot")
+    assert not auth.has_scope("bot", "move")
+
+
+def test_scopes_follow_direct_token_edits():
+    auth = AuthManager()
+    auth.generate_token("bot", scopes=["connect"])
+    assert not auth.has_scope("bot", "act")
+
+    token = auth.tokens["bot"]
+    auth.tokens["bot"] = AgentToken(
+        agent_id="bot",
+        token_hash=token.token_hash,
+        created_at_us=token.created_at_us,
+        expires_at_us=token.expires_at_us,
+        scopes=["connect", "act"]
+    )
+    assert auth.has_scope("bot", "act")
+
+    auth.tokens["bot"].scopes = frozenset()
+    assert not auth.has_scope("bot", "connect")
+
+
+def test_unknown_action_types_share_one_rate_slot(monkeypatch):
+    monkeypatch.setattr(auth_mod, "DEFAULT_RATE_LIMIT", 2)
+    auth = AuthManager()
+    auth.record_action("bot", "wave")
+    auth.record_action("bot", "dance")
+    assert not auth.check_rate_limit("bot", "jump")
+    assert auth.check_rate_limit("bot", ActionKind.MESSAGES)
+
+    for i in range(50):
+        auth.record_action("bot", f"invented_{i}")
+    assert len(auth.rate_counters["bot"].counts) == len(ActionKind) + 1
+
+
+def test_rate_windows_dropped_on_revoke_and_when_stale(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(auth_mod.time, "monotonic", lambda: clock[0])
+    auth = AuthManager()
+
+    auth.generate_token("gone")
+    auth.record_action("gone", ActionKind.MESSAGES)
+    auth.revoke_token("gone")
+    assert "gone" not in auth.rate_counters
+
+    auth.record_action("idle", ActionKind.MOVES)
+    clock[0] += auth_mod.RATE_WINDOW + 1
+    auth.record_action("active", ActionKind.MOVES)
+    assert set(auth.rate_counters) == {"active"}
+    assert auth.check_rate_limit("idle", ActionKind.MOVES)
+
+
+def test_get_events_matches_list_slice():
+    storage = InMemoryStorage(capacity=5)
+    for i in range(8):
+        storage.log_event({"n": i})
+    kept = [{"n": i} for i in range(3, 8)]
+
+    for limit in (0, 1, 3, 5, 10, -2, -10):
+        assert storage.get_events(limit) == kept[-limit:]
+
+
+if __name__ == "__main__":
+    test_region_access_follows_set_regions()
+    test_region_access_follows_direct_edits()
+    test_region_access_wildcard_and_ban()
+    test_region_wildcard_normalised_to_flag()
+    test_region_wildcard_normalised_on_assignment()
+    test_scopes_follow_token_changes()
+    test_scopes_follow_direct_token_edits()
+    test_get_events_matches_list_slice()
+    print("✅ All tests passed!")
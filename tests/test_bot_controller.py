@@ -0,0 +1,188 @@
+"""Test ClawBots OpenSim bot controller"""
+import sys
+sys.path.insert(0, 'src')
+
+import asyncio
+import json
+import time
+
+import opensim.bot_controller as controller_mod
+from opensim.bot_controller import BotController, BotState, MOVE_SETTLE
+
+
+class _GridResponse:
+    def __init__(self, payload):
+        self.status = 200
+        self._body = json.dumps(payload).encode()
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeGrid:
+    """Stands in for the grid's HTTP session: logins succeed, actions return 200."""
+
+    def post(self, url, **kwargs):
+        if "/agent/" in url:
+            return _GridResponse({})
+        return _GridResponse({
+            "login": "true",
+            "agent_id": "uuid-1",
+            "session_id": "s1",
+            "region_name": "Main"
+        })
+
+
+async def _online_bot(controller, agent_id):
+    bot = await controller.create_bot(agent_id, "Test", agent_id, "secret")
+    bot.is_mock = True  # No grid calls
+    controller._set_state(bot, BotState.ONLINE)
+    return bot
+
+
+def test_stats_reflect_message_counts():
+    async def run():
+        controller = BotController("http://grid.invalid")
+        await _online_bot(controller, "b1")
+        await _online_bot(controller, "b2")
+
+        # Prime the per-bot snapshot before any message is sent
+        assert controller.get_stats()["total_messages"] == 0
+
+        await controller.bot_say("b1", "hello")
+        await controller.bot_shout("b1", "HELLO")
+        await controller.bot_whisper("b2", "mock-nobody", "psst")
+        await controller.flush()
+        return controller.get_stats()
+
+    stats = asyncio.run(run())
+    per_bot = {b["agent_id"]: b["message_count"] for b in stats["bots"]}
+    assert stats["total_messages"] == 3
+    assert per_bot == {"b1": 2, "b2": 1}
+    assert sum(per_bot.values()) == stats["total_messages"]
+
+
+def test_stats_reflect_moves_and_teleports():
+    async def run():
+        controller = BotController("http://grid.invalid")
+        await _online_bot(controller, "b1")
+        controller.get_stats()
+
+        await controller.move_bot("b1", 10.0, 20.0)
+        moved = controller.get_stats()["bots"][0]
+        await controller.bot_teleport("b1", "Forest", 1.0, 2.0, 3.0)
+        teleported = controller.get_stats()["bots"][0]
+        return moved, teleported
+
+    moved, teleported = asyncio.run(run())
+    assert moved["move_count"] == 1
+    assert moved["position"]["x"] == 10.0
+    assert teleported["region"] == "Forest"
+    assert teleported["position"] == {"x": 1.0, "y": 2.0, "z": 3.0}
+
+
+def test_tick_settles_only_bots_idle_since_last_move():
+    async def run():
+        controller = BotController("http://grid.invalid")
+        await _online_bot(controller, "still")
+        await _online_bot(controller, "walker")
+        await controller.move_bot("still", 1.0, 1.0)
+        await controller.move_bot("walker", 2.0, 2.0)
+        return controller
+
+    controller = asyncio.run(run())
+    still, walker = controller.bots["still"], controller.bots["walker"]
+    still.last_move = time.monotonic() - MOVE_SETTLE - 1.0
+
+    controller._tick(time.time())
+    assert still.state == BotState.ONLINE
+    assert walker.state == BotState.MOVING
+    assert controller.get_stats()["bots"][1]["state"] == BotState.MOVING.value
+
+    walker.last_move = time.monotonic() - MOVE_SETTLE - 1.0
+    controller._tick(time.time())
+    assert walker.state == BotState.ONLINE
+    assert controller._moving_ids == set()
+    assert controller.get_stats()["bots"][1]["state"] == BotState.ONLINE.value
+
+
+def test_uuid_and_region_indexes_follow_login_teleport_logout():
+    async def run():
+        controller = BotController("http://grid.invalid", session=_FakeGrid())
+        await controller.create_bot("b1", "Test", "Bot", "secret")
+        await controller.login_bot("b1")
+        bot = controller.get_bot("b1")
+        logged_in = (
+            controller.get_bot_by_uuid("uuid-1") is bot,
+            controller.get_bots_in_region("Main") == [bot]
+        )
+
+        await controller.bot_teleport("b1", "Forest")
+        teleported = (
+            controller.get_bots_in_region("Main"),
+            controller.get_bots_in_region("Forest") == [bot]
+        )
+
+        await controller.logout_bot("b1")
+        logged_out = (
+            controller.get_bot_by_uuid("uuid-1"),
+            controller.get_bots_in_region("Forest")
+        )
+        return logged_in, teleported, logged_out
+
+    logged_in, teleported, logged_out = asyncio.run(run())
+    assert logged_in == (True, True)
+    assert teleported == ([], True)
+    assert logged_out == (None, [])
+
+
+def test_first_mover_wakes_idle_loop(monkeypatch):
+    monkeypatch.setattr(controller_mod, "IDLE_TICK", 60.0)
+    monkeypatch.setattr(controller_mod, "MOVING_TICK", 0.02)
+    monkeypatch.setattr(controller_mod, "MOVE_SETTLE", 0.05)
+
+    async def run():
+        controller = BotController("http://grid.invalid")
+        await _online_bot(controller, "b1")
+        controller._running = True
+        loop_task = asyncio.create_task(controller._update_loop())
+        await asyncio.sleep(0.05)  # Loop is now in its long idle wait
+
+        await controller.move_bot("b1", 5.0, 5.0)
+        moving = controller.bots["b1"].state
+        await asyncio.sleep(0.3)
+        settled = controller.bots["b1"].state
+
+        controller._running = False
+        loop_task.cancel()
+        return moving, settled
+
+    moving, settled = asyncio.run(run())
+    assert moving == BotState.MOVING
+    assert settled == BotState.ONLINE
+
+
+def test_stats_bots_list_is_per_call():
+    async def run():
+        controller = BotController("http://grid.invalid")
+        await _online_bot(controller, "b1")
+        return controller
+
+    controller = asyncio.run(run())
+    controller.get_stats()["bots"].clear()
+    assert len(controller.get_stats()["bots"]) == 1
+
+
+if __name__ == "__main__":
+    test_stats_reflect_message_counts()
+    test_stats_reflect_moves_and_teleports()
+    test_tick_settles_only_bots_idle_since_last_move()
+    test_uuid_and_region_indexes_follow_login_teleport_logout()
+    test_stats_bots_list_is_per_call()
+    print("✅ All tests passed!")
@@ -0,0 +1,108 @@
+"""Test ClawBots avatar embodiment"""
+import sys
+sys.path.insert(0, 'src')
+
+import pytest
+
+from world.embodiment import AvatarManager
+
+
+def _visible_ids(manager, region=None):
+    return sorted(data["agent_id"] for data in manager.get_all_visible(region))
+
+
+def test_visible_falls_back_to_avatars_without_region():
+    manager = AvatarManager()
+    manager.create_avatar("a1")
+    manager.create_avatar("a2")
+    assert _visible_ids(manager, "main") == ["a1", "a2"]
+
+
+def test_visible_follows_region_changes():
+    manager = AvatarManager()
+    manager.create_avatar("a1", region="main")
+    manager.create_avatar("a2", region="forest")
+    manager.create_avatar("a3")
+    assert _visible_ids(manager, "main") == ["a1", "a3"]
+
+    manager.set_region("a2", "main")
+    manager.set_region("a3", "forest")
+    assert _visible_ids(manager, "main") == ["a1", "a2"]
+    assert _visible_ids(manager, "forest") == ["a3"]
+
+    manager.set_region("a1", None)
+    assert _visible_ids(manager, "forest") == ["a1", "a3"]
+    assert _visible_ids(manager) == ["a1", "a2", "a3"]
+
+
+def test_visible_drops_removed_and_recreated_avatars():
+    manager = AvatarManager()
+    manager.create_avatar("a1", region="main")
+    manager.create_avatar("a2", region="main")
+    manager.remove_avatar("a2")
+    assert _visible_ids(manager, "main") == ["a1"]
+
+    manager.create_avatar("a1", region="forest")
+    assert _visible_ids(manager, "main") == []
+    assert _visible_ids(manager, "forest") == ["a1"]
+
+
+def test_avatar_data_follows_direct_field_changes():
+    manager = AvatarManager()
+    avatar = manager.create_avatar("a1")
+    assert manager.get_avatar_data("a1")["is_flying"] is False
+
+    avatar.is_flying = True
+    assert manager.get_avatar_data("a1")["is_flying"] is True
+
+    avatar.expression = "happy"
+    assert manager.get_avatar_data("a1")["expression"] == "happy"
+
+
+def test_avatar_data_follows_manager_changes():
+    manager = AvatarManager()
+    manager.create_avatar("a1")
+    first = manager.get_avatar_data("a1")
+    assert manager.get_avatar_data("a1") is first
+
+    manager.sit_down("a1")
+    manager.attach("a1", "hat")
+    manager.update_appearance("a1", hair_style="long")
+    data = manager.get_avatar_data("a1")
+    assert data["is_sitting"] is True
+    assert data["attachments"] == ["hat"]
+    assert data["appearance"]["hair_style"] == "long"
+
+    manager.detach("a1", "hat")
+    assert manager.get_avatar_data("a1")["attachments"] == []
+
+
+def test_region_is_read_only():
+    manager = AvatarManager()
+    avatar = manager.create_avatar("a1", region="main")
+    with pytest.raises(AttributeError):
+        avatar.region = "forest"
+    assert avatar.region == "main"
+    assert _visible_ids(manager, "main") == ["a1"]
+
+
+def test_visible_keeps_insertion_order():
+    manager = AvatarManager()
+    names = [f"agent_{i}" for i in range(20)]
+    for agent_id in reversed(names):
+        manager.create_avatar(agent_id, region="main")
+    manager.create_avatar("unplaced")
+
+    visible = [data["agent_id"] for data in manager.get_all_visible("main")]
+    assert visible == names[::-1] + ["unplaced"]
+
+
+if __name__ == "__main__":
+    test_visible_falls_back_to_avatars_without_region()
+    test_visible_follows_region_changes()
+    test_visible_drops_removed_and_recreated_avatars()
+    test_avatar_data_follows_direct_field_changes()
+    test_avatar_data_follows_manager_changes()
+    test_region_is_read_only()
+    test_visible_keeps_insertion_order()
+    print("✅ All tests passed!")
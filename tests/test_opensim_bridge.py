@@ -0,0 +1,54 @@
+"""Test ClawBots OpenSim bridge sync cadence"""
+import sys
+sys.path.insert(0, 'src')
+
+import asyncio
+
+import opensim.bridge as bridge_mod
+from opensim.bridge import OpenSimBridge
+from opensim.config import OpenSimConfig
+
+
+def test_full_pass_runs_under_constant_movement(monkeypatch):
+    monkeypatch.setattr(bridge_mod, "SYNC_INTERVAL", 0.05)
+    
+    async def run():
+        bridge = OpenSimBridge(world_engine=None, config=OpenSimConfig())
+        passes = []
+        
+        async def record(agent_ids=None):
+            passes.append(agent_ids)
+        
+        bridge._sync_positions = record
+        bridge._running = True
+        task = asyncio.create_task(bridge._sync_loop())
+        
+        # One agent moves every 10ms, well inside SYNC_INTERVAL
+        for _ in range(40):
+            bridge._pending_sync.add("mover")
+            bridge._sync_wake.set()
+            await asyncio.sleep(0.01)
+        
+        bridge._running = False
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return passes
+    
+    passes = asyncio.run(run())
+    full_passes = [p for p in passes if p is None]
+    event_passes = [p for p in passes if p is not None]
+    
+    # ~0.4s of traffic with a 0.05s interval: expect several full passes
+    assert len(full_passes) >= 4
+    assert event_passes and all(p <= {"mover"} for p in event_passes)
+
+
+def test_stats_follow_config_changes():
+    bridge = OpenSimBridge(world_engine=None, config=OpenSimConfig())
+    assert bridge.get_stats()["sync_enabled"]["chat"] is True
+
+    bridge.config.sync_chat = False
+    assert bridge.get_stats()["sync_enabled"]["chat"] is False
+
+    bridge.config = OpenSimConfig(grid_name="Other Grid")
+    assert bridge.get_stats()["grid_name"] == "Other Grid"
@@ -0,0 +1,117 @@
+"""Test ClawBots AgentRegistry"""
+import sys
+sys.path.insert(0, 'src')
+
+from datetime import datetime
+
+from registry.agents import AgentRegistry, InMemoryAgentStorage
+
+
+def test_agent_config_timestamps_are_iso_strings():
+    registry = AgentRegistry()
+    config = registry.register("Alpha")
+    data = registry.get_agent_config(config.agent_id)
+
+    assert datetime.fromisoformat(data["created_at"]) == config.created_at_dt
+    assert data["last_seen"] is None
+
+    registry.update_stats(config.agent_id, messages=1)
+    data = registry.get_agent_config(config.agent_id)
+    assert datetime.fromisoformat(data["last_seen"]) == config.last_seen_dt
+    assert isinstance(config.last_seen, float)
+
+
+def test_timestamps_round_trip_through_storage():
+    storage = InMemoryAgentStorage()
+    registry = AgentRegistry(storage)
+    config = registry.register("Alpha")
+    registry.update_stats(config.agent_id, actions=1)
+
+    reloaded = AgentRegistry(storage).get(config.agent_id)
+    assert abs(reloaded.created_at - config.created_at) < 1e-3
+    assert abs(reloaded.last_seen - config.last_seen) < 1e-3
+
+
+def test_legacy_naive_timestamps_load_as_utc():
+    storage = InMemoryAgentStorage()
+    storage.agents["alpha_1"] = {
+        "agent_id": "alpha_1",
+        "name": "Alpha",
+        "created_at": "2024-01-02T03:04:05",
+        "last_seen": None,
+    }
+    registry = AgentRegistry(storage)
+    data = registry.get_agent_config("alpha_1")
+    assert data["created_at"] == "2024-01-02T03:04:05+00:00"
+
+
+def test_agent_config_follows_updates():
+    registry = AgentRegistry()
+    config = registry.register("Alpha", owner_id="owner1")
+    assert registry.get_agent_config(config.agent_id)["name"] == "Alpha"
+
+    registry.update(config.agent_id, {"name": "Beta", "avatar": {"height": 2.0}})
+    data = registry.get_agent_config(config.agent_id)
+    assert data["name"] == "Beta"
+    assert data["avatar"]["height"] == 2.0
+
+    registry.update_stats(config.agent_id, messages=2)
+    assert registry.get_agent_config(config.agent_id)["total_messages"] == 2
+
+
+def test_agent_config_is_a_copy():
+    storage = InMemoryAgentStorage()
+    registry = AgentRegistry(storage)
+    config = registry.register("Alpha", tags=["scout"])
+
+    data = registry.get_agent_config(config.agent_id)
+    data["name"] = "Mallory"
+    data["avatar"]["height"] = 9.0
+    data["tags"].append("admin")
+
+    fresh = registry.get_agent_config(config.agent_id)
+    assert fresh["name"] == "Alpha"
+    assert fresh["avatar"]["height"] == 1.8
+    assert config.tags == ["scout"]
+    assert storage.agents[config.agent_id]["avatar"]["height"] == 1.8
+
+
+def test_name_index_follows_changes():
+    registry = AgentRegistry()
+    config = registry.register("Alpha Scout")
+    agent_id = config.agent_id
+    assert registry.get_by_name("scout") == [config]
+
+    registry.update(agent_id, {"name": "Beta Ranger"})
+    assert registry.get_by_name("scout") == []
+    assert registry.get_by_name("ranger") == [config]
+    assert registry.get_by_name("be") == [config]
+
+    registry.unregister(agent_id)
+    assert registry.get_by_name("ranger") == []
+    assert registry.get_by_name("be") == []
+
+
+def test_owner_index_follows_changes():
+    registry = AgentRegistry()
+    config = registry.register("Alpha", owner_id="owner1")
+    agent_id = config.agent_id
+    assert registry.get_by_owner("owner1") == [config]
+
+    registry.update(agent_id, {"owner_id": "owner2"})
+    assert registry.get_by_owner("owner1") == []
+    assert registry.get_by_owner("owner2") == [config]
+
+    registry.unregister(agent_id)
+    assert registry.get_by_owner("owner2") == []
+
+
+if __name__ == "__main__":
+    test_agent_config_timestamps_are_iso_strings()
+    test_timestamps_round_trip_through_storage()
+    test_legacy_naive_timestamps_load_as_utc()
+    test_agent_config_follows_updates()
+    test_agent_config_is_a_copy()
+    test_name_index_follows_changes()
+    test_owner_index_follows_changes()
+    print("✅ All tests passed!")
@@ -0,0 +1,41 @@
+"""Test ClawBots spectator sessions"""
+import sys
+sys.path.insert(0, 'src')
+
+import asyncio
+
+from spectator.session import SpectatorManager
+from world.engine import WorldEngine
+
+
+def test_session_indexes_follow_connect_and_disconnect():
+    async def run():
+        manager = SpectatorManager(WorldEngine(), mcp_server=None)
+        s1 = await manager.connect("human1", "bot1")
+        s2 = await manager.connect("human1", "bot2")
+        s3 = await manager.connect("human2", "bot1")
+        connected = (
+            {s.session_id for s in manager.get_sessions_for_agent("bot1")},
+            {s.session_id for s in manager.get_sessions_for_human("human1")}
+        )
+
+        await manager.disconnect(s1.session_id)
+        await manager.disconnect(s2.session_id)
+        remaining = (
+            [s.session_id for s in manager.get_sessions_for_agent("bot1")],
+            manager.get_sessions_for_human("human1"),
+            manager.get_sessions_for_agent("bot2")
+        )
+        return (s1, s2, s3), connected, remaining
+
+    (s1, s2, s3), connected, remaining = asyncio.run(run())
+    assert connected == (
+        {s1.session_id, s3.session_id},
+        {s1.session_id, s2.session_id}
+    )
+    assert remaining == ([s3.session_id], [], [])
+
+
+if __name__ == "__main__":
+    test_session_indexes_follow_connect_and_disconnect()
+    print("✅ All tests passed!")
@@ -0,0 +1,24 @@
+"""Test ClawBots time utilities"""
+import sys
+sys.path.insert(0, 'src')
+
+import time
+from datetime import datetime, timezone
+
+from timeutil import utc_iso_now
+
+
+def test_utc_iso_now_is_naive_second_resolution_utc():
+    before = int(time.time())
+    stamp = utc_iso_now()
+    after = int(time.time())
+
+    parsed = datetime.fromisoformat(stamp)
+    assert parsed.tzinfo is None
+    assert parsed.microsecond == 0
+    assert before <= parsed.replace(tzinfo=timezone.utc).timestamp() <= after
+
+
+if __name__ == "__main__":
+    test_utc_iso_now_is_naive_second_resolution_utc()
+    print("✅ All tests passed!")